@@ -23,6 +23,7 @@ __all__ = [
     "predicates",
     "runtime_overload",
     "type_repr",
+    "validate",
     "version_info",
 ]
 
@@ -42,6 +43,7 @@ from .arg_validation import (
     enforce_annotations,
     enforce_types,
     enforce_values,
+    validate,
 )
 from .multimethod import Multimethod, runtime_overload
 from .types import DEFAULT_ENFORCE_OPTIONS, ClassInfo, EnforceOptions
@@ -57,27 +59,25 @@ class _VersionInfo(NamedTuple):
 
 
 def _parse_version(v: str) -> _VersionInfo:
-    m = __import__("re").match(
-        r"^(?P<maj>\d+)\.(?P<min>\d+)\.(?P<mic>\d+)(?:(?P<lvl>a|b|rc))?$",
-        v,
+    # hand-rolled "X.Y.Z[a|b|rc]" parser, avoids importing re at import time
+    major, minor, micro = v.split(".") if v.count(".") == 2 else ("", "", "")
+
+    lvl: _ReleaseLevel = "final"
+    lvl_map: tuple[tuple[str, _ReleaseLevel], ...] = (
+        ("rc", "candidate"),
+        ("a", "alpha"),
+        ("b", "beta"),
     )
-    if not m:
+    for suffix, level in lvl_map:
+        if micro.endswith(suffix):
+            micro, lvl = micro[: -len(suffix)], level
+            break
+
+    if not (major.isdecimal() and minor.isdecimal() and micro.isdecimal()):
         # fallback if someone sets a non-PEP440 string
         return _VersionInfo(0, 0, 0, "alpha")
 
-    lvl_map: dict[str | None, _ReleaseLevel] = {
-        None: "final",
-        "a": "alpha",
-        "b": "beta",
-        "rc": "candidate",
-    }
-    lvl = m.group("lvl")
-    return _VersionInfo(
-        int(m.group("maj")),
-        int(m.group("min")),
-        int(m.group("mic")),
-        lvl_map[lvl],
-    )
+    return _VersionInfo(int(major), int(minor), int(micro), lvl)
 
 
 version_info = _parse_version(__version__)
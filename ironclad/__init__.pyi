@@ -22,6 +22,9 @@ from .arg_validation import (
 from .arg_validation import (
     enforce_values as enforce_values,
 )
+from .arg_validation import (
+    validate as validate,
+)
 from .multimethod import Multimethod as Multimethod
 from .multimethod import runtime_overload as runtime_overload
 from .types import DEFAULT_ENFORCE_OPTIONS as DEFAULT_ENFORCE_OPTIONS
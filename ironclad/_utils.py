@@ -1,7 +1,9 @@
 """Utility functions for argument type parsing and predicate conversion."""
 
 import functools
-from collections.abc import Mapping, MutableSequence, Sequence
+import operator
+import weakref
+from collections.abc import Callable, Mapping, MutableSequence, Sequence
 from collections.abc import Set as AbcSet
 from types import UnionType
 from typing import (
@@ -24,6 +26,25 @@ __license__ = "MIT"
 
 _CACHE_SIZE = 2048
 
+Checker = Callable[[Any], bool]
+
+_MAX_UNROLLED_SLOTS = 32
+"""The most slots a fixed-size tuple hint's checker is unrolled for."""
+
+
+def _spec_contains_int(spec: Any, /) -> bool:
+    stack = [spec]
+    while stack:
+        current = stack.pop()
+        if current is int:
+            return True
+        if get_origin(current) in (Union, UnionType, tuple):
+            stack.extend(get_args(current))
+    return False
+
+
+_spec_contains_int_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(_spec_contains_int)
+
 
 def spec_contains_int(spec: Any) -> bool:
     """Check if a type spec contains an int.
@@ -34,133 +55,309 @@ def spec_contains_int(spec: Any) -> bool:
     Returns:
         bool: Whether the spec contains an int.
     """
-    if spec is int:
-        return True
+    try:
+        return _spec_contains_int_cached(spec)
+    except TypeError:  # unhashable spec, don't cache
+        return _spec_contains_int(spec)
 
-    origin = get_origin(spec)
-    if origin in (Union, UnionType, tuple):
-        return any(spec_contains_int(arg) for arg in get_args(spec))
 
-    return False
+def _accept_any(_: Any, /) -> bool:
+    return True
 
 
-def _matches_typevar(x: Any, hint: Any, opts: EnforceOptions, /) -> bool:
-    if isinstance(hint, TypeVar):
-        if hint.__constraints__:
-            return any(matches_hint(x, ht, opts) for ht in hint.__constraints__)
-        if hint.__bound__:
-            return matches_hint(x, hint.__bound__, opts)
-        return True
+def _is_none(x: Any, /) -> bool:
+    return x is None
+
+
+def _compile_typevar(hint: Any, opts: EnforceOptions, /) -> Checker | None:
+    if not isinstance(hint, TypeVar):
+        return None
+
+    if hint.__constraints__:
+        constraints = tuple(compile_hint(ht, opts) for ht in hint.__constraints__)
+        return lambda x: any(check(x) for check in constraints)
+    if hint.__bound__:
+        return compile_hint(hint.__bound__, opts)
+    return _accept_any
 
-    return False
 
+def _compile_literal(args: tuple[Any, ...], /) -> Checker:
+    try:
+        values = frozenset(args)
+    except TypeError:  # unhashable literal values can only be compared
+        return lambda x: x in args
+
+    def check_literal(x: Any) -> bool:
+        try:
+            return x in values
+        except TypeError:  # unhashable x can still be compared by equality
+            return x in args
+
+    return check_literal
 
-def _matches_typing_hint(
-    x: Any, hint: Any, origin: Any, opts: EnforceOptions, /
-) -> bool:
+
+def _compile_typing_hint(
+    hint: Any, origin: Any, args: tuple[Any, ...], opts: EnforceOptions, /
+) -> Checker | None:
     if origin is type:  # see if x is a subclass of the type inside type[T]
-        (t,) = get_args(hint) or (object,)
-        return isinstance(x, type) and (t is object or issubclass(x, t))
+        (t,) = args or (object,)
+        if t is object:
+            return lambda x: isinstance(x, type)
+        return lambda x: isinstance(x, type) and issubclass(x, t)
 
-    if origin is Annotated:  # check if the base type matches
-        base, *_ = get_args(hint)
-        return matches_hint(x, base, opts)
+    if origin is Annotated:  # only the base type matters
+        base, *_ = args
+        return compile_hint(base, opts)
 
     if origin is Literal:  # see if x is a value in the literal
-        return x in set(get_args(hint))
+        return _compile_literal(args)
 
     if origin in (Union, UnionType):
-        return any(matches_hint(x, ht, opts) for ht in get_args(hint))
+        return _compile_union(args, opts)
 
-    return _matches_typevar(x, hint, opts)
+    return _compile_typevar(hint, opts)
 
 
-def _matches_collection_hint(
-    x: Any, hint: Any, origin: Any, opts: EnforceOptions, /
-) -> bool:
-    if origin is tuple:
-        args: tuple[Any, ...] = get_args(hint)
+def _compile_each(container: Any, elem: Checker, /) -> Checker:
+    if elem is _accept_any:  # e.g. list[Any], nothing to check per element
+        return lambda x: isinstance(x, container)
 
-        if len(args) == 2 and args[1] is ...:  # any size tuple (tuple[T, ...])
-            return isinstance(
-                x, tuple
-            ) and all(  # make sure all items inside the tuple match the type
-                matches_hint(elem, args[0], opts) for elem in x
-            )
-
-        return (
-            isinstance(x, tuple)
-            and len(x) == len(args)
-            and all(  # make sure all items inside the tuple match the type
-                matches_hint(elem, ht, opts) for elem, ht in zip(x, args, strict=False)
-            )
+    def check_each(x: Any) -> bool:
+        if not isinstance(x, container):
+            return False
+        # a plain loop beats all(map(...)) unless the element checker is a C
+        # function and the container is long, which is the less common case
+        for e in x:  # noqa: SIM110 (a plain loop is faster than all())
+            if not elem(e):
+                return False
+        return True
+
+    return check_each
+
+
+def _compile_fixed_tuple(slots: tuple[Checker, ...], /) -> Checker:
+    n = len(slots)
+    if n > _MAX_UNROLLED_SLOTS:
+        # pair each slot's checker with its element without a Python-level loop
+        return lambda x: (
+            isinstance(x, tuple) and len(x) == n and all(map(operator.call, slots, x))
         )
 
-    if origin in (list, set, frozenset, Sequence, AbcSet, MutableSequence):
-        elem = (get_args(hint) or (Any,))[0]
-        return isinstance(x, origin) and all(matches_hint(e, elem, opts) for e in x)
+    # unroll the slot checks into one straight-line expression, so short tuples
+    # don't pay for setting up an iterator on every call
+    # (slots that accept anything only need to exist)
+    namespace: dict[str, Any] = {f"_c{i}": check for i, check in enumerate(slots)}
+    checks = "".join(
+        f" and _c{i}(x[{i}])"
+        for i, check in enumerate(slots)
+        if check is not _accept_any
+    )
+    source = (
+        "def check_tuple(x):\n"
+        f"    return isinstance(x, tuple) and len(x) == {n}{checks}\n"
+    )
+    code = compile(source, "<ironclad:tuple>", "exec")
+    exec(code, namespace)  # noqa: S102 (source is generated above, not user input)
+    check_tuple: Checker = namespace["check_tuple"]
+    return check_tuple
 
-    if origin in (dict, Mapping):
+
+def _compile_mapping(k_check: Checker, v_check: Checker, /) -> Checker:
+    if v_check is _accept_any:  # iterating a mapping only visits its keys
+        return _compile_each(Mapping, k_check)
+
+    def check_mapping(x: Any) -> bool:
         if not isinstance(x, Mapping):
             return False
+        # one pass over the items, stopping at the first bad entry
+        for k, v in x.items():  # noqa: SIM110 (a plain loop is faster than all())
+            if not (k_check(k) and v_check(v)):
+                return False
+        return True
 
-        k_hint, v_hint = get_args(hint) or (Any, Any)
+    return check_mapping
 
-        return all(
-            matches_hint(k, k_hint, opts) and matches_hint(v, v_hint, opts)
-            for k, v in x.items()
-        )
 
-    return False
+def _compile_collection_hint(
+    origin: Any, args: tuple[Any, ...], opts: EnforceOptions, /
+) -> Checker | None:
+    if origin is tuple:
+        if not args:  # bare tuple hints accept any tuple
+            return lambda x: isinstance(x, tuple)
+
+        if len(args) == 2 and args[1] is ...:  # any size tuple (tuple[T, ...])
+            return _compile_each(tuple, compile_hint(args[0], opts))
+
+        return _compile_fixed_tuple(tuple(compile_hint(ht, opts) for ht in args))
 
+    if origin in (list, set, frozenset, Sequence, AbcSet, MutableSequence):
+        return _compile_each(origin, compile_hint((args or (Any,))[0], opts))
+
+    if origin in (dict, Mapping):
+        k_hint, v_hint = args or (Any, Any)
+        return _compile_mapping(compile_hint(k_hint, opts), compile_hint(v_hint, opts))
 
-def _matches_normal(x: Any, hint: Any, origin: Any, opts: EnforceOptions, /) -> bool:
-    try:  # normal classes/ABCs, @runtime_checkable Protocols
-        if isinstance(hint, type):
-            if not opts.allow_subclasses:
-                return type(x) is hint
-            # separate case for restriction on bools as ints
-            if opts.strict_bools and hint is int:
-                return type(x) is int
+    return None
 
-        return isinstance(x, hint)
+
+def _supports_isinstance(hint: type, /) -> bool:
+    try:  # e.g. non-@runtime_checkable Protocols can't be used with isinstance
+        isinstance(None, hint)
     except TypeError:
-        # fallback for typing objects on older Python versions
-        # BUT don't throw away type args (like list[int])
-        if origin is not None and not get_args(hint):
-            return matches_hint(x, origin, opts)
+        return False
+    return True
+
+
+def _is_exact_class(hint: Any, opts: EnforceOptions, /) -> bool:
+    # whether a class hint only accepts instances of exactly that class
+    return not opts.allow_subclasses or (opts.strict_bools and hint is int)
+
+
+def _compile_normal(
+    hint: Any, origin: Any, args: tuple[Any, ...], opts: EnforceOptions, /
+) -> Checker:
+    if isinstance(hint, type):
+        if not opts.allow_subclasses:
+            return lambda x: type(x) is hint
+        # separate case for restriction on bools as ints
+        if opts.strict_bools and hint is int:
+            return lambda x: type(x) is int
+
+        if _supports_isinstance(hint):
+            # the metaclass hook bound to the hint is what isinstance() calls,
+            # so use it as the checker directly instead of wrapping isinstance()
+            instancecheck: Checker = type(hint).__instancecheck__.__get__(hint)
+            return instancecheck
+
+    # fallback for typing objects on older Python versions
+    # BUT don't throw away type args (like list[int])
+    fallback = compile_hint(origin, opts) if origin is not None and not args else None
+
+    def check_normal(x: Any) -> bool:
+        try:  # ABCs, @runtime_checkable Protocols
+            return isinstance(x, hint)
+        except TypeError:
+            return fallback is not None and fallback(x)
+
+    return check_normal
+
+
+def _compile_union(members: tuple[Any, ...], opts: EnforceOptions, /) -> Checker:
+    # plain class members are folded into one isinstance() call on a tuple and
+    # one set lookup for exact classes; only the rest need their own checkers
+    if any(ht is Any for ht in members):  # Any is a class on 3.11+, don't split it
+        return _accept_any
+
+    instance: list[type] = []
+    exact: set[type] = set()
+    rest: list[Any] = []
+    for ht in members:
+        if isinstance(ht, type) and _is_exact_class(ht, opts):
+            exact.add(ht)
+        elif isinstance(ht, type) and _supports_isinstance(ht):
+            instance.append(ht)
+        else:
+            rest.append(ht)
+
+    classes = tuple(instance)
+    exact_classes = frozenset(exact)
+
+    if not rest:
+        if not exact_classes:
+            return lambda x: isinstance(x, classes)
+        if not classes:
+            return lambda x: type(x) in exact_classes
+        return lambda x: isinstance(x, classes) or type(x) in exact_classes
+
+    check_rest = _compile_union_rest(tuple(rest), opts)
+    return lambda x: isinstance(x, classes) or type(x) in exact_classes or check_rest(x)
+
+
+_DISPATCHABLE_ORIGINS = (list, set, frozenset, dict, tuple)
+"""Generic origins whose checkers reject any value that isn't an instance of them."""
+
+
+def _compile_union_rest(hints: tuple[Any, ...], opts: EnforceOptions, /) -> Checker:
+    checks = tuple(compile_hint(ht, opts) for ht in hints)
+    if len(checks) == 1:
+        return checks[0]
+    if _accept_any in checks:
+        return _accept_any
+
+    # a value whose type is exactly one of these origins can only match the
+    # members with that origin (or members with no dispatchable origin at
+    # all), so e.g. list[int] | dict[str, int] never tries the dict checker
+    # on a list; anything else, like subclasses, tries every member
+    keyed: dict[type, list[Checker]] = {}
+    unkeyed: list[Checker] = []
+    for ht, check in zip(hints, checks, strict=True):
+        origin = get_origin(ht)
+        if origin in _DISPATCHABLE_ORIGINS:
+            keyed.setdefault(origin, []).append(check)
+        else:
+            unkeyed.append(check)
+    by_type = {
+        origin: (*keyed_checks, *unkeyed) for origin, keyed_checks in keyed.items()
+    }
+
+    def check_rest(x: Any) -> bool:
+        candidates = by_type.get(type(x), checks)
+        for check in candidates:  # noqa: SIM110 (a plain loop is faster than any())
+            if check(x):
+                return True
         return False
 
+    return check_rest
 
-@functools.lru_cache(maxsize=_CACHE_SIZE)
-def _hint_pred_cached(
-    hint: Any, /, *, allow_subclasses: bool, check_defaults: bool, strict_bools: bool
-) -> Predicate[Any]:
-    # cached wrapper around matches_hint for hashable hints
-    opts = EnforceOptions(
-        allow_subclasses=allow_subclasses,
-        check_defaults=check_defaults,
-        strict_bools=strict_bools,
-    )
-    return Predicate(lambda x: matches_hint(x, hint, opts), f"'{type_repr(hint)}'")
 
+def compile_hint(hint: Any, opts: EnforceOptions, /) -> Checker:
+    """Compile a type hint into a checker function.
+
+    All of the hint inspection is done up front, so the returned function
+    does the minimum amount of work per value.
+
+    Args:
+        hint (Any): The type hint.
+        opts (EnforceOptions): Type hint enforcement options.
+
+    Returns:
+        Checker: A function returning whether a value matches the hint.
+    """
+    if hint is Any or (hint is object and opts.allow_subclasses):  # can be anything
+        return _accept_any
 
-def _hint_pred_uncached(
-    hint: Any, /, *, allow_subclasses: bool, check_defaults: bool, strict_bools: bool
-) -> Predicate[Any]:
-    # cached wrapper around matches_hint for hashable hints
-    opts = EnforceOptions(
-        allow_subclasses=allow_subclasses,
-        check_defaults=check_defaults,
-        strict_bools=strict_bools,
+    if hint is None or isinstance(hint, type(None)):  # hint is None, so x must be
+        return _is_none
+
+    # the only typing introspection; checkers capture what they need from it
+    origin, args = get_origin(hint), get_args(hint)
+    return (
+        _compile_collection_hint(origin, args, opts)
+        or _compile_typing_hint(hint, origin, args, opts)
+        or _compile_normal(hint, origin, args, opts)
     )
-    # fallback if hint is unhashable
-    return Predicate(lambda x: matches_hint(x, hint, opts), f"'{type_repr(hint)}'")
+
+
+# options -> hint -> predicate; entries live as long as something uses them
+_HINT_PREDS: dict[EnforceOptions, weakref.WeakValueDictionary[Any, Predicate[Any]]] = {}
+
+
+def _hint_pred(hint: Any, opts: EnforceOptions, /) -> Predicate[Any]:
+    return Predicate(compile_hint(hint, opts), f"'{type_repr(hint)}'")
+
+
+# callers often keep only pred.func, letting the predicate drop out of
+# _HINT_PREDS; this keeps recently used ones alive so they aren't rebuilt
+_hint_pred_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(_hint_pred)
+
+_compile_hint_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(compile_hint)
 
 
 def matches_hint(x: Any, hint: Any, opts: EnforceOptions, /) -> bool:
     """Check if an object matches the given type hint.
 
+    The hint is compiled into a checker once and reused for later calls.
+
     Args:
         x (Any): The object to check.
         hint (Any): The type hint.
@@ -169,21 +366,11 @@ def matches_hint(x: Any, hint: Any, opts: EnforceOptions, /) -> bool:
     Returns:
         bool: Whether the object matches the hint.
     """
-    if hint is Any:  # can be anything
-        return True
-
-    if hint is None or isinstance(hint, type(None)):  # hint is None, so x must be
-        return x is None
-
-    origin = get_origin(hint)
-
-    if _matches_collection_hint(x, hint, origin, opts):
-        return True
-
-    if _matches_typing_hint(x, hint, origin, opts):
-        return True
-
-    return _matches_normal(x, hint, origin, opts)
+    try:
+        check = _compile_hint_cached(hint, opts)
+    except TypeError:  # unhashable hint, don't cache
+        check = compile_hint(hint, opts)
+    return bool(check(x))
 
 
 def as_predicate(spec: Any, options: EnforceOptions) -> Predicate[Any]:
@@ -198,19 +385,16 @@ def as_predicate(spec: Any, options: EnforceOptions) -> Predicate[Any]:
     """
     if isinstance(spec, Predicate):
         return spec
+
+    preds = _HINT_PREDS.get(options)
+    if preds is None:
+        preds = _HINT_PREDS[options.interned()] = weakref.WeakValueDictionary()
+
     try:
-        # try to hash
-        return _hint_pred_cached(
-            spec,
-            allow_subclasses=options.allow_subclasses,
-            check_defaults=options.check_defaults,
-            strict_bools=options.strict_bools,
-        )
-    except TypeError:
-        # unhashable, don't cache
-        return _hint_pred_uncached(
-            spec,
-            allow_subclasses=options.allow_subclasses,
-            check_defaults=options.check_defaults,
-            strict_bools=options.strict_bools,
-        )
+        pred = preds.get(spec)
+    except TypeError:  # unhashable, don't cache
+        return _hint_pred(spec, options)
+
+    if pred is None:
+        pred = preds[spec] = _hint_pred_cached(spec, options)
+    return pred
@@ -1,23 +1,34 @@
 """Argument validation functions, including type and value enforcing."""
 
+import contextlib
 import functools
 import inspect
-from collections.abc import Callable
+import sys
+import weakref
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from reprlib import Repr
+from types import FunctionType
 from typing import (
     Any,
+    Never,
     ParamSpec,
     TypeVar,
     get_type_hints,
 )
 
-from ._utils import as_predicate, matches_hint, spec_contains_int
+from ._utils import as_predicate, compile_hint, spec_contains_int
 from .predicates import Predicate
 from .type_repr import type_repr
 from .types import DEFAULT_ENFORCE_OPTIONS, ClassInfo, EnforceOptions
 
-__all__ = ["coerce_types", "enforce_annotations", "enforce_types", "enforce_values"]
+__all__ = [
+    "coerce_types",
+    "enforce_annotations",
+    "enforce_types",
+    "enforce_values",
+    "validate",
+]
 
 __author__ = "Zentiph"
 __license__ = "MIT"
@@ -33,79 +44,165 @@ _SHORT.maxstring = 80
 _SHORT.maxother = 80
 
 
+_MISSING: Any = object()
+"""Marks a bound parameter slot that received no value."""
+
+_EMPTY_VARKW: Any = object()
+"""Default marker for **kwargs, which needs a new dict on every call."""
+
+
 @dataclass(frozen=True)
 class _Plan:
+    names: tuple[str, ...]  # every parameter, in signature order
+    name_to_index: dict[str, int]
+    kw_index: dict[str, int]  # only parameters that can be passed by keyword
     pos_names: tuple[str, ...]
-    vararg_name: str | None
-    varkw_name: str | None
-    need_kwonly_bind: bool
+    posonly_count: int
+    kwonly: tuple[tuple[str, int], ...]
+    kwonly_names: frozenset[str]
+    required: tuple[int, ...]
+    defaults: tuple[tuple[int, Any], ...]
+    vararg_index: int | None
+    varkw_index: int | None
 
 
 def _bind_fallback(
+    plan: _Plan,
     sig: inspect.Signature,
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
     /,
-    *,
-    apply_defaults: bool,
-) -> dict[str, Any]:
-    bound = sig.bind(*args, **kwargs)
-    if apply_defaults:
-        bound.apply_defaults()
-    return bound.arguments
+) -> list[Any]:
+    # only reached for calls the plan can't bind itself (usually bad calls),
+    # so inspect can produce the correct error
+    arguments = sig.bind(*args, **kwargs).arguments
+    return [arguments.get(name, _MISSING) for name in plan.names]
 
 
 def _map_kwargs(
-    mapping: dict[str, Any],
+    values: list[Any],
     plan: _Plan,
     kwargs: dict[str, Any],
     /,
 ) -> bool:
-    dup_keys = [k for k in kwargs if k in mapping]
-    if dup_keys:
-        return False  # need to fallback
-
-    if plan.varkw_name is None:
-        # ensure all kwargs hit known names
-        unknown = [k for k in kwargs if k not in plan.pos_names]
-        if unknown:
-            return False  # need to fallback
-        # safe to overwrite/add names params only
-        for k in kwargs.keys() & set(plan.pos_names):
-            mapping[k] = kwargs[k]
-
-    else:  # plan.varkw_name is not None
-        extra: dict[str, Any] = {}
-        for k, v in kwargs.items():
-            if k in plan.pos_names:
-                mapping[k] = v
-            else:
-                extra[k] = v
-
-        if extra:
-            varkw = mapping.get(plan.varkw_name)
-            if not isinstance(varkw, dict):
-                mapping[plan.varkw_name] = extra
-            else:
-                varkw.update(extra)
+    kw_index = plan.kw_index
+    varkw_index = plan.varkw_index
+    extra: dict[str, Any] | None = None  # only allocated if there are extras
+
+    for k, v in kwargs.items():
+        idx = kw_index.get(k)
+        if idx is not None:
+            if values[idx] is not _MISSING:
+                return False  # duplicate value, need to fallback
+            values[idx] = v
+        elif varkw_index is None:
+            return False  # unknown name, need to fallback
+        elif extra is None:
+            extra = {k: v}
+        else:
+            extra[k] = v
+
+    if extra is not None and varkw_index is not None:
+        values[varkw_index] = extra
 
     return True
 
 
 def _make_plan(sig: inspect.Signature) -> _Plan:
-    pos, vararg, varkw, need_kwonly = [], None, None, False
-    for param in sig.parameters.values():
-        if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
-            pos.append(param.name)
-            if param.default is not inspect.Parameter.empty:
-                need_kwonly = True
-        elif param.kind is inspect.Parameter.VAR_POSITIONAL:
-            vararg = param.name
+    names: list[str] = []
+    pos: list[str] = []
+    kw_index: dict[str, int] = {}
+    kwonly: list[tuple[str, int]] = []
+    required: list[int] = []
+    defaults: list[tuple[int, Any]] = []
+    vararg, varkw = None, None
+    posonly_count = 0
+
+    for i, param in enumerate(sig.parameters.values()):
+        # names from code objects are interned already, but signatures can be
+        # built by hand; interned names let kwargs lookups compare by identity
+        name = sys.intern(param.name)
+        names.append(name)
+
+        if param.kind is inspect.Parameter.POSITIONAL_ONLY:
+            pos.append(name)
+            posonly_count += 1
+        elif param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            pos.append(name)
+            kw_index[name] = i
         elif param.kind is inspect.Parameter.KEYWORD_ONLY:
-            need_kwonly = True
-        elif param.kind is inspect.Parameter.VAR_KEYWORD:
-            varkw = param.name
-    return _Plan(tuple(pos), vararg, varkw, need_kwonly)
+            kwonly.append((name, i))
+            kw_index[name] = i
+        elif param.kind is inspect.Parameter.VAR_POSITIONAL:
+            vararg = i
+            continue
+        else:  # VAR_KEYWORD
+            varkw = i
+            continue
+
+        if param.default is inspect.Parameter.empty:
+            required.append(i)
+        else:
+            defaults.append((i, param.default))
+
+    return _Plan(
+        names=tuple(names),
+        name_to_index={name: i for i, name in enumerate(names)},
+        kw_index=kw_index,
+        pos_names=tuple(pos),
+        posonly_count=posonly_count,
+        kwonly=tuple(kwonly),
+        kwonly_names=frozenset(name for name, _ in kwonly),
+        required=tuple(required),
+        defaults=tuple(defaults),
+        vararg_index=vararg,
+        varkw_index=varkw,
+    )
+
+
+# decoration-time introspection caches, keyed weakly by the function itself
+_SIGNATURES: weakref.WeakKeyDictionary[
+    Callable[..., Any], tuple[inspect.Signature, _Plan]
+] = weakref.WeakKeyDictionary()
+_TYPE_HINTS: weakref.WeakKeyDictionary[Callable[..., Any], dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _signature_and_plan(func: Callable[..., Any], /) -> tuple[inspect.Signature, _Plan]:
+    with contextlib.suppress(KeyError, TypeError):  # TypeError: not weak-referencable
+        return _SIGNATURES[func]
+
+    sig = inspect.signature(func)
+    result = (sig, _make_plan(sig))
+    with contextlib.suppress(TypeError):
+        _SIGNATURES[func] = result
+    return result
+
+
+def _type_hints(func: Callable[..., Any], /) -> dict[str, Any]:
+    # the returned dict is shared between callers, so it must not be mutated
+    with contextlib.suppress(KeyError, TypeError):
+        return _TYPE_HINTS[func]
+
+    hints = get_type_hints(func, include_extras=True)
+    with contextlib.suppress(TypeError):
+        _TYPE_HINTS[func] = hints
+    return hints
+
+
+def _needed_defaults(
+    plan: _Plan, names: Iterable[str], /
+) -> tuple[tuple[int, Any], ...]:
+    # the (index, default) pairs of the given parameters that have a default,
+    # in the same form as _Plan.defaults; unknown names are ignored
+    indices = {plan.name_to_index[name] for name in names if name in plan.name_to_index}
+    defaults = [(i, default) for i, default in plan.defaults if i in indices]
+    if plan.vararg_index in indices:
+        defaults.append((plan.vararg_index, ()))
+    if plan.varkw_index in indices:
+        defaults.append((plan.varkw_index, _EMPTY_VARKW))
+    return tuple(defaults)
 
 
 def _fast_bind(
@@ -113,60 +210,340 @@ def _fast_bind(
     sig: inspect.Signature,
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
-    *,
-    apply_defaults: bool,
-) -> dict[str, Any]:
-    # fast path if no kw-only/defaults and kwargs only fill tail names
-    if plan.need_kwonly_bind:
-        return _bind_fallback(sig, args, kwargs, apply_defaults=apply_defaults)
+    defaults: tuple[tuple[int, Any], ...] = (),
+) -> list[Any]:
+    # bind into a list of values indexed like plan.names, with _MISSING for
+    # parameters that received nothing. only the given defaults are applied
+    values = _bind_values(plan, args, kwargs)
+    if values is None:
+        values = _bind_fallback(plan, sig, args, kwargs)
 
-    # map pure positionals
-    mapping: dict[str, Any] = {}
-    n_pos = min(len(args), len(plan.pos_names))
-    if n_pos:
-        mapping.update(zip(plan.pos_names[:n_pos], args[:n_pos], strict=False))
+    for i, default in defaults:
+        if values[i] is _MISSING:
+            values[i] = {} if default is _EMPTY_VARKW else default
+
+    return values
+
+
+def _bind_values(
+    plan: _Plan, args: tuple[Any, ...], kwargs: dict[str, Any], /
+) -> list[Any] | None:
+    # returns None if the call can't be bound here
+    n_pos = len(plan.pos_names)
+    n_args = len(args)
+    values = [_MISSING] * len(plan.names)
 
-    # too many positionals without *varargs; fallback for correct error
-    if len(args) > n_pos:
-        if plan.vararg_name is None:
-            return _bind_fallback(sig, args, kwargs, apply_defaults=apply_defaults)
-        mapping[plan.vararg_name] = tuple(args[n_pos:])
+    # map pure positionals
+    if n_args > n_pos:
+        # too many positionals without *varargs
+        if plan.vararg_index is None:
+            return None
+        values[:n_pos] = args[:n_pos]
+        values[plan.vararg_index] = args[n_pos:]
+    else:
+        values[:n_args] = args
 
     # kwargs mapping
-    if kwargs and not _map_kwargs(mapping, plan, kwargs):
-        return _bind_fallback(sig, args, kwargs, apply_defaults=apply_defaults)
+    if kwargs and not _map_kwargs(values, plan, kwargs):
+        return None
+
+    # missing required params
+    for i in plan.required:
+        if values[i] is _MISSING:
+            return None
+
+    return values
 
-    # optionally inject defaults (only safe if no kw-only/defaults; else bailed already)
-    if apply_defaults:
-        for param in sig.parameters.values():
-            if (
-                param.default is not inspect.Parameter.empty
-                and param.name not in mapping
-            ):
-                mapping[param.name] = param.default
 
-    return mapping
+def _fill_posonly_gaps(args: list[Any], plan: _Plan, /) -> None:
+    # positional-only params can't be moved to kwargs, so gaps before the last
+    # bound one are filled with their defaults to pass everything by position
+    for i in range(plan.posonly_count - 1, -1, -1):
+        if args[i] is not _MISSING:
+            if any(val is _MISSING for val in args[:i]):
+                defaults = dict(plan.defaults)
+                for j in range(i):
+                    if args[j] is _MISSING:
+                        args[j] = defaults[j]
+            return
 
 
 def _to_call_args(
-    mapping: dict[str, Any], plan: _Plan, /
+    values: list[Any], plan: _Plan, /
 ) -> tuple[tuple[Any, ...], dict[str, Any]]:
-    # positional params
-    args_list = [mapping[name] for name in plan.pos_names]
-
-    # *varargs
-    if plan.vararg_name and plan.vararg_name in mapping:
-        args_list.extend(mapping[plan.vararg_name])
-    # kwargs + **varkw
+    n_pos = len(plan.pos_names)
+    args = values[:n_pos]
     kwargs: dict[str, Any] = {}
-    for name, val in mapping.items():
-        if name in plan.pos_names or name in (plan.vararg_name, plan.varkw_name):
-            continue
-        kwargs[name] = val
-    if plan.varkw_name and plan.varkw_name in mapping:
-        kwargs.update(mapping[plan.varkw_name])
 
-    return tuple(args_list), kwargs
+    if plan.posonly_count:
+        _fill_posonly_gaps(args, plan)
+
+    # positional params, up to the first one left to its default
+    for i, val in enumerate(args):
+        if val is _MISSING:
+            # anything bound after a gap has to be passed by keyword
+            kwargs.update(
+                (plan.names[j], args[j])
+                for j in range(i + 1, n_pos)
+                if args[j] is not _MISSING
+            )
+            del args[i:]
+            break
+    else:  # *varargs
+        if plan.vararg_index is not None:
+            varargs = values[plan.vararg_index]
+            if varargs is not _MISSING:
+                args.extend(varargs)
+
+    # kw-only params + **varkw
+    for name, i in plan.kwonly:
+        if values[i] is not _MISSING:
+            kwargs[name] = values[i]
+    if plan.varkw_index is not None:
+        varkw = values[plan.varkw_index]
+        if varkw is not _MISSING:
+            kwargs.update(varkw)
+
+    return tuple(args), kwargs
+
+
+def _make_raiser(
+    qualname: str, name: str, pred: Predicate[Any], suffix: str, /
+) -> Callable[[Any], Never]:
+    # everything in the message except the value is fixed per parameter, so
+    # the wrappers only need to hold one callable per checked parameter
+    def raise_(val: Any) -> Never:
+        # TODO show generic typed types for 'got' section
+        #      like list[int] or tuple[int, str]
+        #      (right now it just shows list)
+        raise TypeError(
+            f"{qualname}(): '{name}' expected {pred.render_msg(val)}{suffix}, "
+            f"got '{type_repr(type(val))}' with value {_SHORT.repr(val)}"
+        )
+
+    return raise_
+
+
+def _make_value_raiser(
+    qualname: str, name: str, pred: Predicate[Any], /
+) -> Callable[[Any], Never]:
+    # the enforce_values counterpart of _make_raiser
+    def raise_(val: Any) -> Never:
+        raise ValueError(
+            f"{qualname}(): '{name}' failed constraint: "
+            f"{pred.render_msg(val)}; got {_SHORT.repr(val)}"
+        )
+
+    return raise_
+
+
+def _make_return_raiser(qualname: str, hint: Any, /) -> Callable[[Any], Never]:
+    # the enforce_annotations counterpart of _make_raiser
+    def raise_(out: Any) -> Never:
+        raise TypeError(
+            f"{qualname}(): return expected {type_repr(hint)}, "
+            f"got {type_repr(type(out))}"
+        )
+
+    return raise_
+
+
+def _light_wraps(wrapper: Callable[..., Any], func: Callable[..., Any], /) -> Any:
+    # functools.wraps without its per-attribute getattr/setattr loop, for the
+    # common case of wrapping a plain function
+    if not isinstance(func, FunctionType):
+        return functools.update_wrapper(wrapper, func)
+
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__annotations__ = func.__annotations__
+    if sys.version_info >= (3, 12):  # PEP 695 type parameters, as wraps copies
+        wrapper.__type_params__ = func.__type_params__
+    if func.__dict__:
+        wrapper.__dict__.update(func.__dict__)
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _coercing_wrapper(
+    func: Callable[P, T],
+    slots: tuple[tuple[int, Coercer], ...],
+    checks: tuple[tuple[int, Callable[[Any], Any], Callable[[Any], Never]], ...],
+    defaults: tuple[tuple[int, Any], ...],
+    /,
+) -> Callable[..., T]:
+    # a wrapper that binds once, coerces the values in slots, then runs the
+    # (index, checker, raiser) checks on the coerced values
+    sig, plan = _signature_and_plan(func)
+    # **kwargs is bound into a new dict, so changes a coercer makes to it
+    # in place only reach the function through a rebuild
+    always_rebuild = any(idx == plan.varkw_index for idx, _ in slots)
+
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        bound = _fast_bind(plan, sig, args, kwargs, defaults)
+
+        changed = always_rebuild
+        for idx, coerce in slots:
+            val = bound[idx]
+            if val is not _MISSING:
+                new = coerce(val)
+                if new is not val:
+                    bound[idx] = new
+                    changed = True
+
+        for idx, check, raise_ in checks:
+            val = bound[idx]
+            # unchecked defaults are left unbound
+            if val is not _MISSING and not check(val):
+                raise_(val)
+
+        # values that are already the right type don't need a rebuild
+        if not changed:
+            return func(*args, **kwargs)
+
+        # rebuild call args and invoke
+        call_args, call_kwargs = _to_call_args(bound, plan)
+        return func(*call_args, **call_kwargs)
+
+    return wrapper
+
+
+def _require_params(
+    func: Callable[..., Any], sig: inspect.Signature, names: Iterable[str], /
+) -> None:
+    # validate all arguments given exist in the function signature
+    for name in names:
+        if name not in sig.parameters:
+            raise ValueError(f"Unknown parameter '{name}' in {func.__qualname__}")
+
+
+def _type_checks(
+    func: Callable[..., Any],
+    plan: _Plan,
+    options: EnforceOptions,
+    types: dict[str, Any],
+    /,
+) -> tuple[
+    tuple[tuple[int, Callable[[Any], Any], Callable[[Any], Never]], ...],
+    tuple[tuple[int, Any], ...],
+]:
+    # the (index, checker, raiser) checks and the defaults to apply for
+    # enforcing types on func's parameters
+    validators: dict[str, Predicate[Any]] = {
+        name: as_predicate(spec, options) for name, spec in types.items()
+    }
+
+    # the option notes in error messages only depend on the decoration
+    conditions: list[str] = []
+    if not options.allow_subclasses:
+        conditions.append("no subclasses")
+    # only add bool info if there's an int in the types
+    if options.strict_bools and any(spec_contains_int(v) for v in types.values()):
+        conditions.append("no bools as ints")
+    suffix = f" ({', '.join(conditions)})" if conditions else ""
+
+    defaults = _needed_defaults(plan, validators) if options.check_defaults else ()
+    # call the compiled checkers directly; the predicates themselves are
+    # only needed to render the message once a check fails
+    checks = tuple(
+        (
+            plan.name_to_index[name],
+            pred.func,
+            _make_raiser(func.__qualname__, name, pred, suffix),
+        )
+        for name, pred in validators.items()
+    )
+    return checks, defaults
+
+
+def _value_checks(
+    func: Callable[..., Any],
+    plan: _Plan,
+    predicate_map: dict[str, Predicate[Any]],
+    /,
+) -> tuple[
+    tuple[tuple[int, Callable[[Any], Any], Callable[[Any], Never]], ...],
+    tuple[tuple[int, Any], ...],
+]:
+    # the enforce_values counterpart of _type_checks
+    defaults = _needed_defaults(plan, predicate_map)
+    # call the predicate functions directly, skipping Predicate.__call__
+    checks = tuple(
+        (
+            plan.name_to_index[name],
+            pred.func,
+            _make_value_raiser(func.__qualname__, name, pred),
+        )
+        for name, pred in predicate_map.items()
+    )
+    return checks, defaults
+
+
+def _generate_wrapper(
+    func: Callable[..., Any],
+    checks: tuple[tuple[int, Callable[[Any], Any], Callable[[Any], Never]], ...],
+    defaults: tuple[tuple[int, Any], ...],
+    returns: tuple[Callable[[Any], Any], Callable[[Any], Never]] | None = None,
+    /,
+) -> Callable[..., Any]:
+    # generate a wrapper with the checks unrolled into straight-line code.
+    # the most common call shape (every positional parameter passed
+    # positionally, no keyword arguments) checks args directly without
+    # binding; any other call shape is bound first. returns is an optional
+    # (checker, raiser) pair for the return value
+    if returns is None:
+        call_pos = "return _func(*args)"
+        call_any = "return _func(*args, **kwargs)"
+        ret_lines: list[str] = []
+    else:
+        call_pos = "out = _func(*args)"
+        call_any = "out = _func(*args, **kwargs)"
+        ret_lines = ["if not _check_out(out):", "    _raise_out(out)", "return out"]
+
+    sig, plan = _signature_and_plan(func)
+
+    namespace: dict[str, Any] = {
+        "_func": func,
+        "_bind": _fast_bind,
+        "_plan": plan,
+        "_sig": sig,
+        "_defaults": defaults,
+        "_MISSING": _MISSING,
+    }
+    if returns is not None:
+        namespace["_check_out"], namespace["_raise_out"] = returns
+    lines = ["def wrapper(*args, **kwargs):"]
+
+    n = len(plan.pos_names)
+    if (
+        n
+        and all(idx < n for idx, _, _ in checks)
+        and not any(plan.names[i] in plan.kwonly_names for i in plan.required)
+    ):
+        lines.append(f"    if not kwargs and len(args) == {n}:")
+        for i, _, _ in checks:
+            lines.append(f"        if not _c{i}(args[{i}]):")
+            lines.append(f"            _r{i}(args[{i}])")
+        lines.append(f"        {call_pos}")
+        lines.extend(f"        {line}" for line in ret_lines)
+
+    lines.append("    values = _bind(_plan, _sig, args, kwargs, _defaults)")
+    for i, check, raise_ in checks:
+        namespace[f"_c{i}"] = check
+        namespace[f"_r{i}"] = raise_
+        # parameters left to unapplied defaults stay unbound and aren't checked
+        lines.append(f"    val = values[{i}]")
+        lines.append(f"    if val is not _MISSING and not _c{i}(val):")
+        lines.append(f"        _r{i}(val)")
+    lines.append(f"    {call_any}")
+    lines.extend(f"    {line}" for line in ret_lines)
+
+    code = compile("\n".join(lines), f"<ironclad:{func.__qualname__}>", "exec")
+    exec(code, namespace)  # noqa: S102 (source is generated above, not user input)
+    wrapper: Callable[..., Any] = namespace["wrapper"]
+    return wrapper
 
 
 def enforce_types(
@@ -199,57 +576,18 @@ def enforce_types(
         TypeError: report(): 'code' expected 'int' (...), got 'float' with value 2.3
         ```
     """
+    # share one options instance so predicate cache lookups match on identity
+    options = options.interned()
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        sig = inspect.signature(func)
+        if not types:  # nothing to enforce
+            return func
 
-        # validate all arguments given exist in the function signature
-        for name in types:
-            if name not in sig.parameters:
-                raise ValueError(f"Unknown parameter '{name}' in {func.__qualname__}")
+        sig, plan = _signature_and_plan(func)
+        _require_params(func, sig, types)
+        checks, defaults = _type_checks(func, plan, options, types)
 
-        plan = _make_plan(sig)
-
-        # compile once
-        validators: dict[str, Predicate[Any]] = {
-            name: as_predicate(spec, options) for name, spec in types.items()
-        }
-
-        @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            bound = _fast_bind(
-                plan, sig, args, kwargs, apply_defaults=options.check_defaults
-            )
-
-            for name, pred in validators.items():
-                val = bound[name]
-                if not pred(val):
-                    conditions = "("
-                    if not options.allow_subclasses:
-                        conditions += "no subclasses"
-                    if options.strict_bools and any(
-                        # only add bool info if there's an int in the types
-                        spec_contains_int(v)
-                        for v in types.values()
-                    ):
-                        if not options.allow_subclasses:
-                            conditions += ", "
-                        conditions += "no bools as ints"
-                    conditions += ")"
-
-                    # TODO show generic typed types for 'got' section
-                    #      like list[int] or tuple[int, str]
-                    #      (right now it just shows list)
-                    raise TypeError(
-                        f"{func.__qualname__}(): '{name}' expected "
-                        f"{pred.render_msg(val)}"
-                        f"{' ' + conditions if conditions != '()' else ''}, "
-                        f"got '{type_repr(type(val))}' with value {_SHORT.repr(val)}"
-                    )
-
-            return func(*args, **kwargs)
-
-        return wrapper
+        return _light_wraps(_generate_wrapper(func, checks, defaults), func)
 
     return decorator
 
@@ -281,26 +619,28 @@ def enforce_annotations(
     """
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        hints = get_type_hints(func, include_extras=True)
+        hints = _type_hints(func)
         param_hints = {k: v for k, v in hints.items() if k != "return"}
 
-        wrapped = enforce_types(**param_hints)(func)
-        if not check_return or "return" not in hints:
-            return wrapped
-
-        @functools.wraps(wrapped)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            out = wrapped(*args, **kwargs)
-
-            if not matches_hint(out, hints["return"], DEFAULT_ENFORCE_OPTIONS):
-                raise TypeError(
-                    f"{func.__qualname__}(): return expected "
-                    f"{type_repr(hints['return'])}, got {type_repr(type(out))}"
-                )
+        returns = None
+        if check_return and "return" in hints:
+            # compiled once here, so Annotated metadata and nested generics are
+            # resolved at decoration time rather than on every return
+            returns = (
+                compile_hint(hints["return"], DEFAULT_ENFORCE_OPTIONS),
+                _make_return_raiser(func.__qualname__, hints["return"]),
+            )
+        elif not param_hints:  # nothing to enforce
+            return func
 
-            return out
+        # one wrapper checks both the parameters and the return value
+        sig, plan = _signature_and_plan(func)
+        _require_params(func, sig, param_hints)
+        checks, defaults = _type_checks(
+            func, plan, DEFAULT_ENFORCE_OPTIONS, param_hints
+        )
 
-        return wrapper
+        return _light_wraps(_generate_wrapper(func, checks, defaults, returns), func)
 
     return decorator
 
@@ -337,22 +677,18 @@ def coerce_types(
     """
 
     def decorator(func: Callable[P, T]) -> Callable[..., T]:
-        sig = inspect.signature(func)
-        plan = _make_plan(sig)
-
-        @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            bound = _fast_bind(plan, sig, args, kwargs, apply_defaults=True)
-
-            for name, coerce in coercers.items():
-                if name in bound:
-                    bound[name] = coerce(bound[name])
-
-            # rebuild call args and invoke
-            call_args, call_kwargs = _to_call_args(bound, plan)
-            return func(*call_args, **call_kwargs)
-
-        return wrapper
+        _, plan = _signature_and_plan(func)
+        defaults = _needed_defaults(plan, coercers)
+        # coercers for names the function doesn't have are ignored
+        slots = tuple(
+            (plan.name_to_index[name], coerce)
+            for name, coerce in coercers.items()
+            if name in plan.name_to_index
+        )
+        if not slots:  # nothing to coerce
+            return func
+
+        return _light_wraps(_coercing_wrapper(func, slots, (), defaults), func)
 
     return decorator
 
@@ -386,29 +722,88 @@ def enforce_values(
     """
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        sig = inspect.signature(func)
+        if not predicate_map:  # nothing to enforce
+            return func
 
-        for name in predicate_map:
-            if name not in sig.parameters:
-                raise ValueError(f"Unknown parameter '{name}' in {func.__qualname__}")
+        sig, plan = _signature_and_plan(func)
+        _require_params(func, sig, predicate_map)
 
-        plan = _make_plan(sig)
+        checks, defaults = _value_checks(func, plan, predicate_map)
+        return _light_wraps(_generate_wrapper(func, checks, defaults), func)
 
-        @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            bound = _fast_bind(plan, sig, args, kwargs, apply_defaults=True)
+    return decorator
+
+
+def validate(
+    options: EnforceOptions = DEFAULT_ENFORCE_OPTIONS,
+    /,
+    *,
+    coerce: Mapping[str, Coercer] | None = None,
+    types: Mapping[str, ClassInfo] | None = None,
+    values: Mapping[str, Predicate[Any]] | None = None,
+) -> Callable[[Callable[P, T]], Callable[..., T]]:
+    """Decorator that coerces, type checks, and value checks parameters in one pass.
 
-            for name, pred in predicate_map.items():
-                val = bound[name]
-                if not pred(val):
-                    raise ValueError(
-                        f"{func.__qualname__}(): '{name}' failed constraint: "
-                        f"{pred.render_msg(val)}; got {_SHORT.repr(val)}"
-                    )
+    This does the work of `coerce_types`, `enforce_types`, and `enforce_values`
+    while binding the arguments only once, so it is the recommended form when
+    more than one of them is needed. Coercion runs first, then the types and
+    values of the coerced arguments are checked.
 
-            call_args, call_kwargs = _to_call_args(bound, plan)
-            return func(*call_args, **call_kwargs)
+    Args:
+        options (EnforceOptions, optional): Type enforcement options.
+            Defaults to DEFAULT_ENFORCE_OPTIONS.
+        coerce (Mapping[str, Coercer] | None, optional): A mapping of argument names
+            to coercion functions. Defaults to None.
+        types (Mapping[str, ClassInfo] | None, optional): A mapping of argument
+            names to expected types. Defaults to None.
+        values (Mapping[str, Predicate[Any]] | None, optional): A mapping of
+            argument names to predicates. Defaults to None.
 
-        return wrapper
+    Examples:
+        ```python
+        >>> import ironclad as ic
+        >>> from ironclad.predicates import POSITIVE
+        >>>
+        >>> @ic.validate(
+        ...     coerce={"qty": int}, types={"qty": int}, values={"qty": POSITIVE}
+        ... )
+        ... def order(item, qty):
+        ...     return f"{qty}x {item}"
+        ...
+        >>> order("apple", "3")
+        '3x apple'
+        >>> order("apple", "0")
+        ValueError: order(): 'qty' failed constraint: expected a positive number; got 0
+        ```
+    """
+    # share one options instance so predicate cache lookups match on identity
+    options = options.interned()
+    coercers = dict(coerce or {})
+    type_specs = dict(types or {})
+    predicate_map = dict(values or {})
+
+    def decorator(func: Callable[P, T]) -> Callable[..., T]:
+        if not (coercers or type_specs or predicate_map):  # nothing to do
+            return func
+
+        sig, plan = _signature_and_plan(func)
+        _require_params(func, sig, (*coercers, *type_specs, *predicate_map))
+
+        slots = tuple(
+            (plan.name_to_index[name], coerce) for name, coerce in coercers.items()
+        )
+        type_checks, type_defaults = _type_checks(func, plan, options, type_specs)
+        value_checks, value_defaults = _value_checks(func, plan, predicate_map)
+        # the same parameter can appear in several mappings
+        defaults = tuple(
+            dict(
+                (*_needed_defaults(plan, coercers), *type_defaults, *value_defaults)
+            ).items()
+        )
+
+        return _light_wraps(
+            _coercing_wrapper(func, slots, type_checks + value_checks, defaults),
+            func,
+        )
 
     return decorator
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import Any, Final, ParamSpec, TypeVar
 
 from .predicates import Predicate
@@ -25,3 +25,11 @@ def coerce_types(
 def enforce_values(
     **predicate_map: Predicate[Any],
 ) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
+def validate(
+    options: EnforceOptions = DEFAULT_ENFORCE_OPTIONS,
+    /,
+    *,
+    coerce: Mapping[str, Coercer] | None = None,
+    types: Mapping[str, ClassInfo] | None = None,
+    values: Mapping[str, Predicate[Any]] | None = None,
+) -> Callable[[Callable[P, T]], Callable[..., T]]: ...
@@ -11,15 +11,19 @@ from __future__ import annotations
 
 import functools
 import inspect
+import operator
 from typing import TYPE_CHECKING, Any
 
 from ._utils import as_predicate
+from .arg_validation import _MISSING, _bind_values, _signature_and_plan
 from .type_repr import type_repr
 from .types import DEFAULT_ENFORCE_OPTIONS, EnforceOptions
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from .arg_validation import _Plan
+
 
 __all__ = ["InvalidOverloadError", "Multimethod", "runtime_overload"]
 
@@ -27,10 +31,63 @@ __author__ = "Zentiph"
 __license__ = "MIT"
 
 
+_MAX_CANDIDATE_KEYS = 256
+"""How many first argument types a Multimethod remembers candidates for."""
+
+_MAX_DISPATCH_KEYS = 256
+"""How many argument type combinations a Multimethod remembers winners for."""
+
+_get_class = operator.attrgetter("__class__")
+
+
 class InvalidOverloadError(TypeError):
     """Raised when an invalid overload is called for a Multimethod."""
 
 
+class _NoMatchMessage:
+    # formats a dispatch failure only when the message is actually shown, so
+    # callers that catch InvalidOverloadError don't pay for it
+    __slots__ = ("arg_types", "has_kwargs", "name", "sigs")
+
+    def __init__(
+        self,
+        name: str,
+        sigs: tuple[inspect.Signature, ...],
+        arg_types: tuple[type, ...],
+        /,
+        *,
+        has_kwargs: bool,
+    ) -> None:
+        self.name = name
+        self.sigs = sigs
+        self.arg_types = arg_types
+        self.has_kwargs = has_kwargs
+
+    def __str__(self) -> str:
+        want = " | ".join(self.__sig_str(sig) for sig in self.sigs)
+        got = ", ".join(type_repr(t) for t in self.arg_types)
+        if self.has_kwargs:
+            got += (", " if got else "") + "**kwargs"
+
+        return f"No overload of {self.name}() matches ({got}). Candidates: {want}"
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __sig_str(self, sig: inspect.Signature, /) -> str:
+        parts: list[str] = []
+
+        for name, param in sig.parameters.items():
+            annotation = (
+                param.annotation
+                if param.annotation is not inspect.Parameter.empty
+                else Any
+            )
+            parts.append(f"{name}: {type_repr(annotation)}")
+
+        return f"{self.name}({', '.join(parts)})"
+
+
 class Multimethod:
     """Runtime overloads with type-hint matching.
 
@@ -58,15 +115,28 @@ class Multimethod:
             options (EnforceOptions, optional): Type enforcement options.
                 Defaults to DEFAULT_ENFORCE_OPTIONS.
         """
+        # what dispatch reads for each overload, in registration order
         self.__implementations: list[
             tuple[
-                inspect.Signature,
-                dict[str, Callable[[Any], bool]],
+                _Plan,
+                tuple[tuple[int, Callable[[Any], Any]], ...],
+                int,
+                tuple[tuple[int, Callable[[Any], Any]], ...],
                 Callable[..., Any],
-                dict[str, Any],
+                int,
             ]
         ] = []
-        self.options = options
+        # only needed for error messages and building the candidate table,
+        # so kept out of the entries dispatch unpacks on every call
+        self.__signatures: list[inspect.Signature] = []
+        self.__first_types: list[type | None] = []
+        # first argument type -> overloads that could accept it
+        self.__candidates: dict[type, list[Any]] = {}
+        # argument types -> winning overload, only used while every overload
+        # is annotated with plain classes or Any
+        self.__dispatch_cache: dict[Any, Callable[..., Any]] = {}
+        self.__cacheable = True
+        self.options = options.interned()
         self.__name__ = getattr(func, "__name__", "overloaded")
         if func is not None:
             self.overload(func)
@@ -81,11 +151,11 @@ class Multimethod:
         Returns:
             Multimethod: The updated Multimethod now including the given function.
         """
-        sig = inspect.signature(func)
-        validators: dict[str, Callable[[Any], bool]] = {}
+        sig, plan = _signature_and_plan(func)
+        checks: list[tuple[int, Callable[[Any], Any]]] = []
         norm_annotation: dict[str, Any] = {}
 
-        for name, param in sig.parameters.items():
+        for i, (name, param) in enumerate(sig.parameters.items()):
             annotation = (
                 param.annotation
                 if param.annotation is not inspect.Parameter.empty
@@ -93,9 +163,38 @@ class Multimethod:
             )
 
             norm_annotation[name] = annotation
-            validators[name] = as_predicate(annotation, self.options)
-
-        self.__implementations.append((sig, validators, func, norm_annotation))
+            if annotation is not Any:  # Any accepts everything
+                checks.append((i, as_predicate(annotation, self.options).func))
+
+        # plain classes on the first positional parameter let calls skip
+        # overloads that can't accept the first argument's type at all
+        first: type | None = None
+        if plan.pos_names:
+            annotation = norm_annotation[plan.pos_names[0]]
+            if type(annotation) is type:
+                first = annotation
+
+        # prefer more specific signatures (less Any)
+        score = sum(annotation is not Any for annotation in norm_annotation.values())
+
+        # calls passing exactly the positional parameters positionally can be
+        # checked against args directly, without binding
+        n_pos = len(plan.pos_names)
+        if any(plan.names[i] in plan.kwonly_names for i in plan.required):
+            n_pos = -1
+        pos_checks = tuple((i, check) for i, check in checks if i < n_pos)
+
+        self.__implementations.append(
+            (plan, tuple(checks), n_pos, pos_checks, func, score)
+        )
+        self.__signatures.append(sig)
+        self.__first_types.append(first)
+        self.__candidates.clear()
+        self.__dispatch_cache.clear()
+        self.__cacheable = self.__cacheable and all(
+            annotation is Any or type(annotation) is type
+            for annotation in norm_annotation.values()
+        )
         return self
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
@@ -107,53 +206,114 @@ class Multimethod:
         Returns:
             Any: The return value matching the overload and arguments called.
         """
-        matches: list[tuple[int, Callable[..., Any]]] = []
-
-        for sig, validators, func, norm_annotation in self.__implementations:
-            try:
-                bound = sig.bind(*args, **kwargs)
-            except TypeError:
+        key = self.__dispatch_key(args, kwargs) if self.__cacheable else None
+        if key is not None:
+            func = self.__dispatch_cache.get(key)
+            if func is not None:
+                return func(*args, **kwargs)
+
+        func = self.__resolve(args, kwargs)
+        if key is not None:
+            if len(self.__dispatch_cache) >= _MAX_DISPATCH_KEYS:
+                self.__dispatch_cache.clear()
+            self.__dispatch_cache[key] = func
+        return func(*args, **kwargs)
+
+    def __resolve(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any], /
+    ) -> Callable[..., Any]:
+        best_score = -1
+        best_func: Callable[..., Any] | None = None
+
+        n_args = len(args)
+        candidates = self.__candidates_for(args)
+        for plan, checks, n_pos, pos_checks, func, score in candidates:
+            # stable tie-breaker = registration order, so overloads that can't
+            # beat the current best don't need to be checked at all
+            if score <= best_score:
                 continue
 
             ok = True
-            for name, val in bound.arguments.items():
-                if not validators[name](val):
-                    ok = False
-                    break
+            if n_args == n_pos and not kwargs:
+                for i, check in pos_checks:
+                    if not check(args[i]):
+                        ok = False
+                        break
+            else:
+                bound = _bind_values(plan, args, kwargs)
+                if bound is None:  # the call doesn't fit this signature
+                    continue
+
+                for i, check in checks:
+                    val = bound[i]
+                    if val is not _MISSING and not check(val):
+                        ok = False
+                        break
 
             if ok:
-                # prefer more specific signatures (less Any)
-                # stable tie-breaker = registration order
-                score = sum(
-                    annotation is not Any for annotation in norm_annotation.values()
-                )
-                matches.append((score, func))
-
-        if not matches:
-            want = " | ".join(self.__sig_str(sig) for sig, *_ in self.__implementations)
-            got = ", ".join(type_repr(type(arg)) for arg in args)
-            if kwargs:
-                got += (", " if got else "") + "**kwargs"
+                best_score, best_func = score, func
 
+        if best_func is None:
             raise InvalidOverloadError(
-                f"No overload of {self.__name__}() matches ({got}). Candidates: {want}"
-            )
-
-        matches.sort(key=lambda t: t[0], reverse=True)
-        return matches[0][1](*args, **kwargs)
-
-    def __sig_str(self, sig: inspect.Signature, /) -> str:
-        parts: list[str] = []
-
-        for name, param in sig.parameters.items():
-            annotation = (
-                param.annotation
-                if param.annotation is not inspect.Parameter.empty
-                else Any
+                _NoMatchMessage(
+                    self.__name__,
+                    tuple(self.__signatures),
+                    tuple(map(type, args)),
+                    has_kwargs=bool(kwargs),
+                )
             )
-            parts.append(f"{name}: {type_repr(annotation)}")
 
-        return f"{self.__name__}({', '.join(parts)})"
+        return best_func
+
+    @staticmethod
+    def __dispatch_key(args: tuple[Any, ...], kwargs: dict[str, Any], /) -> Any:
+        # with only plain class annotations, the winner depends on nothing but
+        # the argument types and keyword names
+        types = tuple(map(type, args))
+        if kwargs:
+            types += tuple(map(type, kwargs.values()))
+            classes = tuple(map(_get_class, (*args, *kwargs.values())))
+        else:
+            classes = tuple(map(_get_class, args))
+
+        # isinstance() also trusts __class__, so objects that fake it can't be
+        # keyed by their real type
+        if classes != types:
+            return None
+        return (types, tuple(kwargs)) if kwargs else types
+
+    def __candidates_for(self, args: tuple[Any, ...], /) -> list[Any]:
+        if not args:
+            return self.__implementations
+
+        key = type(args[0])
+        # isinstance() also trusts __class__, so objects that fake it
+        # (e.g. mocks) can't be narrowed down by their real type
+        if args[0].__class__ is not key:
+            return self.__implementations
+
+        candidates = self.__candidates.get(key)
+        if candidates is None:
+            if len(self.__candidates) >= _MAX_CANDIDATE_KEYS:
+                self.__candidates.clear()
+            candidates = self.__candidates[key] = [
+                impl
+                for impl, first in zip(
+                    self.__implementations, self.__first_types, strict=True
+                )
+                if self.__may_accept(first, key)
+            ]
+        return candidates
+
+    def __may_accept(self, first: type | None, key: type, /) -> bool:
+        # mirrors the checkers compile_hint builds for plain classes
+        if first is None:
+            return True
+        if not self.options.allow_subclasses or (
+            self.options.strict_bools and first is int
+        ):
+            return key is first
+        return issubclass(key, first)
 
 
 def runtime_overload(
@@ -8,6 +8,7 @@ __all__ = [
     "NOT_NONE",
     "POSITIVE",
     "Predicate",
+    "PredicateError",
     "all_of",
     "any_of",
     "between",
@@ -23,7 +24,7 @@ __author__ = "Zentiph"
 __license__ = "MIT"
 
 
-from .predicate import Predicate
+from .predicate import Predicate, PredicateError
 from .predicates import (
     ALWAYS,
     NEGATIVE,
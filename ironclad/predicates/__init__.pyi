@@ -4,6 +4,7 @@ __all__: Final[list[str]]
 
 # thanks ruff formatter, very cool :)
 from .predicate import Predicate as Predicate
+from .predicate import PredicateError as PredicateError
 from .predicates import ALWAYS as ALWAYS
 from .predicates import NEGATIVE as NEGATIVE
 from .predicates import NEVER as NEVER
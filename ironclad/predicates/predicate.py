@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sized
+import functools
+import itertools
+import sys
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any, Generic, Never, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
-__all__ = ["Predicate"]
+__all__ = ["Predicate", "PredicateError"]
 
 __author__ = "Zentiph"
 __license__ = "MIT"
@@ -20,6 +23,221 @@ Obj = TypeVar("Obj", bound=object)
 
 ExceptionFactory = Callable[[str, U, str], BaseException]
 
+_MAX_FUSED_TERMS = 32
+"""The most predicate functions a combinator is fused into straight-line code for."""
+
+
+@functools.lru_cache(maxsize=256)
+def _fuser(
+    op: str, negated: tuple[bool, ...], /
+) -> Callable[..., Callable[[Any], bool]]:
+    # compile (once per operator and pattern of negations) a factory that
+    # fuses functions into one short-circuiting expression, where negated
+    # terms are inlined too: 'True if f0(x) and not f1(x) ... else False'
+    params = ", ".join(f"f{i}" for i in range(len(negated)))
+    expr = f" {op} ".join(
+        f"not f{i}(x)" if neg else f"f{i}(x)" for i, neg in enumerate(negated)
+    )
+    source = (
+        f"def fuse({params}):\n"
+        f"    def fused_{op}(x):\n"
+        f"        return True if {expr} else False\n"
+        f"    return fused_{op}\n"
+    )
+    namespace: dict[str, Any] = {}
+    code = compile(source, f"<ironclad:{op}>", "exec")
+    exec(code, namespace)  # noqa: S102 (source is generated above, not user input)
+    fuse: Callable[..., Callable[[Any], bool]] = namespace["fuse"]
+    return fuse
+
+
+def _fuse(
+    op: str, funcs: tuple[Callable[[Any], Any], ...], negated: tuple[bool, ...], /
+) -> Callable[[Any], bool]:
+    if len(funcs) <= _MAX_FUSED_TERMS:
+        return _fuser(op, negated)(*funcs)
+
+    terms = tuple(
+        _negated(func) if neg else func
+        for func, neg in zip(funcs, negated, strict=True)
+    )
+    quantifier = all if op == "and" else any
+    return lambda x: quantifier(term(x) for term in terms)
+
+
+def _always(_: Any, /) -> bool:
+    return True
+
+
+def _never(_: Any, /) -> bool:
+    return False
+
+
+def _simplify_terms(
+    op: str, funcs: tuple[Callable[[Any], Any], ...], negated: tuple[bool, ...], /
+) -> tuple[tuple[Callable[[Any], Any], ...], tuple[bool, ...]]:
+    # drop terms that cannot change an op combination's result (constant
+    # identities and repeats of an earlier term, as in 'a & a'), and cut it
+    # off after a term that always decides it, since later terms never run
+    absorbing = op == "or"
+    kept_funcs: list[Callable[[Any], Any]] = []
+    kept_negated: list[bool] = []
+    seen: set[tuple[int, bool]] = set()
+    for func, neg in zip(funcs, negated, strict=True):
+        if func is _always or func is _never:
+            if ((func is _always) is not neg) is not absorbing:
+                continue  # identity: 'and' with true or 'or' with false
+            kept_funcs.append(func)
+            kept_negated.append(neg)
+            break
+        # funcs aren't always hashable, but the kept ones stay alive
+        # in kept_funcs, so their ids are stable
+        term = (id(func), neg)
+        if term in seen:
+            continue
+        seen.add(term)
+        kept_funcs.append(func)
+        kept_negated.append(neg)
+
+    if not kept_funcs:  # only identities, so keep one to stay constant
+        return funcs[:1], negated[:1]
+    return tuple(kept_funcs), tuple(kept_negated)
+
+
+def _nth_accepted(bits: Iterable[Any], n: int, /) -> Any:
+    # the nth (1-based) truthy value in bits, or None if there are fewer
+    return next(itertools.islice(filter(None, bits), n - 1, None), None)
+
+
+def _every(func: Callable[[Any], Any], /) -> Callable[[Iterable[Any]], bool]:
+    def every(it: Iterable[Any]) -> bool:
+        for x in it:  # noqa: SIM110 (a plain loop is faster than all())
+            if not func(x):
+                return False
+        return True
+
+    return every
+
+
+def _some(func: Callable[[Any], Any], /) -> Callable[[Iterable[Any]], bool]:
+    def some(it: Iterable[Any]) -> bool:
+        for x in it:  # noqa: SIM110 (a plain loop is faster than any())
+            if func(x):
+                return True
+        return False
+
+    return some
+
+
+def _first(it: Iterable[Any] | None, /) -> Any:
+    # a sample element for messages, without consuming anything from iterators
+    if isinstance(it, Sequence):
+        return it[0] if it else None
+    if it is None or iter(it) is it:
+        return None
+    return next(iter(it), None)
+
+
+def _negated(func: Callable[[Any], Any], /) -> Callable[[Any], bool]:
+    def negated(x: Any) -> bool:
+        return not func(x)
+
+    return negated
+
+
+def _joined_msg(
+    first: Predicate[Any], op: str, rest: tuple[Predicate[Any], ...], /
+) -> Callable[[Any], str]:
+    # nests left to right, like chaining the op would: '((a) and (b)) and (c)'
+    def joined_msg(x: Any) -> str:
+        msg = first.render_msg(x)
+        for pred in rest:
+            msg = f"({msg}) {op} ({pred.render_msg(x)})"
+        return msg
+
+    return joined_msg
+
+
+def _negated_msg(pred: Predicate[Any], /) -> Callable[[Any], str]:
+    def negated_msg(x: Any) -> str:
+        return f"not ({pred.render_msg(x)})"
+
+    return negated_msg
+
+
+class _Context:
+    """A link in a lifted predicate's context chain, pointing from newest to oldest.
+
+    Lifting prepends a link that shares the rest of the chain, so building
+    a chain of n lifts takes n allocations instead of n growing tuple copies.
+    """
+
+    __slots__ = ("parent", "pred")
+
+    def __init__(self, pred: Predicate[Any], parent: _Context | None, /) -> None:
+        self.pred = pred
+        self.parent = parent
+
+    def __iter__(self) -> Iterator[Predicate[Any]]:
+        link: _Context | None = self
+        while link is not None:
+            yield link.pred
+            link = link.parent
+
+
+class PredicateError(ValueError):
+    """Raised by Predicate.validate and validate_many by default.
+
+    The message is rendered only when the error is shown, so callers that catch
+    it don't pay for rendering the predicate message and repr of the value.
+    """
+
+    def __init__(self, pred: Predicate[Any], label: str, x: Any, /) -> None:
+        """Raised by Predicate.validate and validate_many by default.
+
+        Args:
+            pred (Predicate[Any]): The predicate that rejected the value.
+            label (str): The label of the rejected value.
+            x (Any): The rejected value.
+        """
+        super().__init__()
+        self.pred = pred
+        self.label = label
+        self.x = x
+
+    @property
+    def args(self) -> tuple[str]:
+        """The rendered message, like a ValueError's args."""
+        return (str(self),)
+
+    def __str__(self) -> str:
+        """Render the error message.
+
+        Returns:
+            str: The error message.
+        """
+        return f"{self.label}: {self.pred.render_msg(self.x)} (got {self.x!r})"
+
+    def __repr__(self) -> str:
+        """Get a representation of this error.
+
+        Returns:
+            str: The repr.
+        """
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __reduce__(self) -> tuple[type[ValueError], tuple[str]]:
+        """Pickle this error as a plain ValueError with the rendered message.
+
+        Returns:
+            tuple[type[ValueError], tuple[str]]: The reduced error.
+        """
+        # the predicate usually holds lambdas, which can't be pickled
+        return ValueError, self.args
+
+
+_NOT_FUSED: tuple[str, tuple[Any, ...], tuple[bool, ...]] = ("", (), ())
+
 
 class Predicate(Generic[T]):
     """A predicate, containing a predicate function and a failure message.
@@ -28,7 +246,15 @@ class Predicate(Generic[T]):
     the logical operators and ('&'), or ('|'), and not ('~').
     """
 
-    __slots__ = ("__context", "__func", "__msg", "__name")
+    __slots__ = (
+        "__context",
+        "__func",
+        "__fused",
+        "__msg",
+        "__name",
+        "__repr",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -41,6 +267,8 @@ class Predicate(Generic[T]):
 
         Args:
             func (Callable[[T], bool]): The function that accepts or rejects values.
+                Its result is returned as is when the predicate is called,
+                so it should return a bool.
             name (str): The name of the predicate.
             msg (str | Callable[[T | None], str] | None): The rejection message,
                 message supplier, or None for a default message. Defaults to None.
@@ -59,10 +287,32 @@ class Predicate(Generic[T]):
         self.__func = func
         self.__name = name
         self.__msg = msg if msg is not None else name
-        # a stack containing other predicates that are context for this predicate
+        # built on first repr(), since a predicate never changes once handed out
+        self.__repr: str | None = None
+        # a linked stack containing other predicates that are context for this one
         # e.g. if a predicate, pred3, is lifted from pred2 which is lifted from pred1,
-        #      the context of pred3 is (pred1, pred2)
-        self.__context: tuple[Predicate[Any], ...] = ()
+        #      the context of pred3 iterates as pred2, pred1
+        self.__context: _Context | None = None
+        # the operator and functions an '&'/'|' combination was fused from, so
+        # chaining another predicate extends one flat check instead of nesting
+        self.__fused: tuple[str, tuple[Callable[[Any], Any], ...], tuple[bool, ...]] = (
+            _NOT_FUSED
+        )
+
+    def __class_getitem__(cls, item: Any, /) -> type[Predicate[Any]]:
+        """Subscript this class for typing, returning the class itself.
+
+        Type parameters only matter to type checkers, so runtime subscriptions
+        like Predicate[int] skip building a typing alias, which also makes
+        constructing through one as cheap as constructing through the class.
+
+        Args:
+            item (Any): The type parameter.
+
+        Returns:
+            type[Predicate[Any]]: This class.
+        """
+        return cls
 
     # --- core --- #
     def __call__(self, x: T) -> bool:
@@ -74,7 +324,7 @@ class Predicate(Generic[T]):
         Returns:
             bool: Whether the given value is accepted by this predicate.
         """
-        return bool(self.__func(x))
+        return self.__func(x)
 
     # --- props --- #
     @property
@@ -115,10 +365,15 @@ class Predicate(Generic[T]):
             str: The formatted message with the given test value.
         """
         m = self.__msg
-        if callable(m):
+        if type(m) is str:  # the common case, checked before callable()
+            s = m
+        elif callable(m):
             return m(x)
+        else:
+            s = str(m)
 
-        s = str(m)
+        if "{" not in s and "}" not in s:  # static message, nothing to format
+            return s
         try:
             return s.format(x=x)
         except KeyError:  # safeguard for missing format
@@ -136,12 +391,14 @@ class Predicate(Generic[T]):
             str: The formatted message with the given test value.
         """
         msg = self.render_msg(x)
-        if not self.__context:
+        if self.__context is None:
             return msg
 
-        chain = " -> ".join(
-            "'" + pred.name + "'" for pred in (*self.__context[-max_chain + 1 :], self)
-        )
+        # the newest max_chain - 1 context predicates, then this one
+        shown = list(itertools.islice(self.__context, max(max_chain - 1, 0)))
+        shown.reverse()
+        shown.append(self)
+        chain = " -> ".join(f"'{pred.__name}'" for pred in shown)
         return f"{msg} [via {chain}]"
 
     def render_tree(self, x: T | None = None, /) -> str:
@@ -153,14 +410,17 @@ class Predicate(Generic[T]):
         Returns:
             str: The formatted tree with the given test value.
         """
-        lines: list[str] = [f"{self.__name}: {self.render_msg(x)}"]
-        lines.extend(  # newest -> oldest top-down
+        # context predicates are always Predicates, so their slots can be read
+        # directly instead of through the name property
+        return "\n".join(
             [
-                f"\tfrom {pred.name}: {pred.render_msg(x)}"
-                for pred in reversed(self.__context)
+                f"{self.__name}: {self.render_msg(x)}",
+                *(  # newest -> oldest top-down
+                    f"\tfrom {pred.__name}: {pred.render_msg(x)}"
+                    for pred in self.__context or ()
+                ),
             ]
         )
-        return "\n".join(lines)
 
     # --- diagnostics --- #
     def explain(self, x: T) -> str | None:
@@ -195,19 +455,79 @@ class Predicate(Generic[T]):
                 Defaults to ValueError.
 
         Raises:
-            BaseException: If the validation fails, the exception returned
-                by exc_factory will be raised.
+            PredicateError: If the validation fails and exc is ValueError.
+            BaseException: If the validation fails, the exception built
+                from exc will be raised.
 
         Returns:
             T: x, if the predicate accepts it.
         """
         if not self(x):
-            message = f"{label}: {self.render_msg(x)} (got {x!r})"
-            if callable(exc):
-                raise exc(label, x, message)
-            raise exc(message)
+            self.__reject(x, label, exc)
         return x
 
+    def validate_many(
+        self,
+        xs: Iterable[T],
+        /,
+        *,
+        label: str = "value",
+        exc: type[BaseException] | ExceptionFactory[T] = ValueError,
+    ) -> list[T]:
+        """Return the values in xs as a list if all are ok, otherwise raise an error.
+
+        The error is raised for the first rejected value, labeled with its index.
+
+        Args:
+            xs (Iterable[T]): The values to test.
+            label (str, optional): A label for the tested values. Defaults to "value".
+            exc (type[BaseException] | ExceptionFactory[T], optional):
+                An exception or exception factory called on failure.
+                If a factory, it should take a label, the tested value,
+                and error message and return an exception to raise.
+                Defaults to ValueError.
+
+        Raises:
+            PredicateError: If the validation fails and exc is ValueError.
+            BaseException: If the validation fails, the exception built
+                from exc will be raised.
+
+        Returns:
+            list[T]: The values in xs, if the predicate accepts all of them.
+
+        Examples:
+            ```python
+            >>> from ironclad.predicates import POSITIVE
+            >>>
+            >>> POSITIVE.validate_many((1, 2, 3))
+            [1, 2, 3]
+            >>> POSITIVE.validate_many([1, -2], label="sizes")
+            ValueError: sizes[1]: expected a positive number (got -2)
+            ```
+        """
+        values = list(xs)
+        func = self.__func
+        for i, x in enumerate(values):
+            if not func(x):
+                self.__reject(x, f"{label}[{i}]", exc)
+        return values
+
+    def __reject(
+        self,
+        x: T,
+        label: str,
+        exc: type[BaseException] | ExceptionFactory[T],
+        /,
+    ) -> Never:
+        if exc is ValueError:  # the default, so render the message lazily
+            raise PredicateError(self, label, x)
+
+        message = f"{label}: {self.render_msg(x)} (got {x!r})"
+        # exception classes are callable too, so check for them first
+        if isinstance(exc, type) and issubclass(exc, BaseException):
+            raise exc(message)
+        raise exc(label, x, message)
+
     # --- ergonomics --- #
     def with_name(self, name: str) -> Predicate[T]:
         """Clone this predicate and give it a new name.
@@ -231,6 +551,48 @@ class Predicate(Generic[T]):
         """
         return self.clone(msg=msg)
 
+    def with_cache(self, maxsize: int | None = 128) -> Predicate[T]:
+        """Clone this predicate and remember its results for recently tested values.
+
+        Only hashable values are cached, keyed by their type and value, so equal
+        values of different types (like 1 and True) are never confused. Unhashable
+        values are always tested. The predicate function should be pure and the
+        tested values should not be mutated while cached.
+
+        Args:
+            maxsize (int | None, optional): The most results to remember,
+                or None for no limit. Defaults to 128.
+
+        Returns:
+            Predicate[T]: The cloned predicate with a result cache.
+
+        Examples:
+            ```python
+            >>> from ironclad.predicates import Predicate
+            >>>
+            >>> is_prime = Predicate[int](
+            ...     lambda n: n > 1 and all(n % d for d in range(2, n)), "prime"
+            ... ).with_cache()
+            >>> is_prime(7919)  # computed
+            True
+            >>> is_prime(7919)  # remembered
+            True
+            ```
+        """
+        func = self.__func
+        lookup = functools.lru_cache(maxsize=maxsize)(lambda _, x: func(x))
+
+        def cached(x: T) -> bool:
+            try:
+                hash(x)
+            except TypeError:
+                return func(x)
+            return lookup(type(x), x)
+
+        pred = self.clone()
+        pred.__func = cached
+        return pred
+
     # --- combinators ---
     def __and__(self, other: Predicate[T]) -> Predicate[T]:
         """Combine this predicate with another, merging their conditions with an 'AND'.
@@ -241,14 +603,41 @@ class Predicate(Generic[T]):
         Returns:
             Predicate[T]: The combined predicate.
         """
-        return Predicate(
-            lambda x: self(x) and other(x),
-            self.__name + " & " + other.name,
-            lambda x: f"({self.render_msg(x)}) and ({other.render_msg(x)})",
-        )
+        return self._combine("and", (other,))
 
     __rand__ = __and__
 
+    def _combine(self, op: str, others: tuple[Predicate[T], ...], /) -> Predicate[T]:
+        # combine this predicate with others in one step, as if chaining the op,
+        # so all_of/any_of don't build a predicate for every intermediate chain
+        if not others:
+            return self
+        funcs, negated = self.__terms(op)
+        all_funcs, all_negated = list(funcs), list(negated)
+        names = [self.__name]
+        for other in others:
+            funcs, negated = other.__terms(op)
+            all_funcs += funcs
+            all_negated += negated
+            names.append(other.__name)
+        funcs, negated = _simplify_terms(op, tuple(all_funcs), tuple(all_negated))
+
+        # combined names are built fresh each time, so intern them to share
+        # one string between every combination of the same predicates
+        name = sys.intern((" & " if op == "and" else " | ").join(names))
+        pred = Predicate(_fuse(op, funcs, negated), name, _joined_msg(self, op, others))
+        pred.__fused = (op, funcs, negated)
+        return pred
+
+    def __terms(
+        self, op: str, /
+    ) -> tuple[tuple[Callable[[Any], Any], ...], tuple[bool, ...]]:
+        # the (functions, negations) this predicate adds to an op combination
+        fused_op, funcs, negated = self.__fused
+        if fused_op in (op, "not"):
+            return funcs, negated
+        return (self.__func,), (False,)
+
     def __or__(self, other: Predicate[T]) -> Predicate[T]:
         """Combine this predicate with another, merging their conditions with an 'OR'.
 
@@ -258,11 +647,7 @@ class Predicate(Generic[T]):
         Returns:
             Predicate[T]: The combined predicate.
         """
-        return Predicate(
-            lambda x: self(x) or other(x),
-            self.__name + " | " + other.name,
-            lambda x: f"({self.render_msg(x)}) or ({other.render_msg(x)})",
-        )
+        return self._combine("or", (other,))
 
     __ror__ = __or__
 
@@ -272,11 +657,15 @@ class Predicate(Generic[T]):
         Returns:
             Predicate[T]: The negated predicate.
         """
-        return Predicate(
-            lambda x: not self(x),
-            "~" + self.__name,
-            lambda x: f"not ({self.render_msg(x)})",
-        )
+        name = sys.intern("~" + self.__name)
+        fused_op, funcs, _ = self.__fused
+        if fused_op == "not":  # ~~pred tests the same as pred
+            return Predicate(funcs[0], name, _negated_msg(self))
+
+        func = self.__func
+        pred = Predicate(_negated(func), name, _negated_msg(self))
+        pred.__fused = ("not", (func,), (True,))
+        return pred
 
     negate = __invert__
 
@@ -289,7 +678,15 @@ class Predicate(Generic[T]):
         Returns:
             Predicate[T]: The combined predicate.
         """
-        return (self | other) & ~(self & other)
+        # keep the name and message of the composed form, but test each
+        # predicate only once
+        composed = (self | other) & ~(self & other)
+        func, other_func = self.__func, other.func
+        return Predicate(
+            lambda x: (not func(x)) is not (not other_func(x)),
+            composed.name,
+            composed.msg,
+        )
 
     __rxor__ = __xor__
 
@@ -358,7 +755,7 @@ class Predicate(Generic[T]):
         """
         pred = self.clone(name=name, msg=msg)
         pred.__func = func
-        pred.__context = (*self.__context, self)
+        pred.__context = _Context(self, self.__context)
         return pred
 
     def on(
@@ -374,8 +771,9 @@ class Predicate(Generic[T]):
         Returns:
             Predicate[Obj]: The new predicate.
         """
+        func = self.__func
         return Predicate(
-            lambda o: self.__func(getter(o)),
+            lambda o: func(getter(o)),
             self.__name,
             lambda o: self.render_msg(getter(o) if o is not None else None),
         )
@@ -387,11 +785,7 @@ class Predicate(Generic[T]):
             return prefix + self.__msg
 
         def new_msg(it: Iterable[T] | None) -> str:
-            sample: T | None = None
-            if it is not None:
-                it_iter = iter(it)
-                sample = next(it_iter, None)
-            base = self.render_msg(sample)  # handle callable/format uniformly
+            base = self.render_msg(_first(it))  # handle callable/format uniformly
             return f"{prefix}{base}" if prefix else base
 
         return new_msg
@@ -416,8 +810,10 @@ class Predicate(Generic[T]):
         Returns:
             Predicate[Iterable[T]]: The quantified predicate.
         """
+        # map() feeds the quantifier without a generator frame per element
+        func = self.__func
         return self.lift(
-            lambda i: quantifier(self.__func(x) for x in i),
+            lambda i: quantifier(map(func, i)),
             f"{label}({self.__name})",
             self.__msg_over_iter(prefix),
         )
@@ -428,7 +824,13 @@ class Predicate(Generic[T]):
         Returns:
             Predicate[Iterable[T]]: The new predicate.
         """
-        return self.quantify(all, "all", prefix="for every element: ")
+        # a dedicated loop beats all(map(...)) since calls from Python code to
+        # the predicate function don't have to go through the C call machinery
+        return self.lift(
+            _every(self.__func),
+            f"all({self.__name})",
+            self.__msg_over_iter("for every element: "),
+        )
 
     def any(self) -> Predicate[Iterable[T]]:
         """Check if any element in an iterable is accepted.
@@ -436,7 +838,11 @@ class Predicate(Generic[T]):
         Returns:
             Predicate[Iterable[T]]: The new predicate.
         """
-        return self.quantify(any, "any", prefix="for at least one element: ")
+        return self.lift(
+            _some(self.__func),
+            f"any({self.__name})",
+            self.__msg_over_iter("for at least one element: "),
+        )
 
     def at_least(self, n: int) -> Predicate[Iterable[T]]:
         """Check if at least n elements in an iterable are accepted.
@@ -454,16 +860,9 @@ class Predicate(Generic[T]):
             raise ValueError("n must be nonnegative")
 
         def quantifier(bits: Iterable[bool]) -> bool:
-            size = None if not isinstance(bits, Sized) else len(bits)
-            if size is not None and size < n:
-                return False  # break if n is unreachable
-
-            count = 0
-            for b in bits:
-                count += 1 if b else 0
-                if count >= n:
-                    return True
-            return False
+            # the nth accepted element exists; filter() and islice() skip
+            # everything before it without a Python-level loop
+            return n == 0 or _nth_accepted(bits, n) is not None
 
         return self.quantify(
             quantifier, f"at least {n}", prefix=f"for at least {n} elements: "
@@ -485,12 +884,7 @@ class Predicate(Generic[T]):
             raise ValueError("n must be nonnegative")
 
         def quantifier(bits: Iterable[bool]) -> bool:
-            count = 0
-            for b in bits:
-                count += 1 if b else 0
-                if count > n:
-                    return False
-            return True
+            return _nth_accepted(bits, n + 1) is None
 
         return self.quantify(
             quantifier, f"at most {n}", prefix=f"for at most {n} elements: "
@@ -512,16 +906,10 @@ class Predicate(Generic[T]):
             raise ValueError("n must be nonnegative")
 
         def quantifier(bits: Iterable[bool]) -> bool:
-            size = None if not isinstance(bits, Sized) else len(bits)
-            if size is not None and size < n:
-                return False  # break if n is unreachable
-
-            count = 0
-            for b in bits:
-                count += 1 if b else 0
-                if count > n:
-                    return False
-            return count == n
+            accepted = filter(None, bits)
+            if n and _nth_accepted(accepted, n) is None:
+                return False
+            return next(accepted, None) is None  # but no more than n
 
         return self.quantify(
             quantifier, f"exactly {n}", prefix=f"for exactly {n} elements: "
@@ -545,6 +933,8 @@ class Predicate(Generic[T]):
         Returns:
             str: The repr.
         """
-        fn = getattr(self.__func, "__name__", repr(self.__func))
-        m = self.__msg.__qualname__ if callable(self.__msg) else self.__msg
-        return f"Predicate(func={fn}, name={self.__name} msg={m!r})"
+        if self.__repr is None:
+            fn = getattr(self.__func, "__name__", None) or repr(self.__func)
+            m = self.__msg.__qualname__ if callable(self.__msg) else self.__msg
+            self.__repr = f"Predicate(func={fn}, name={self.__name} msg={m!r})"
+        return self.__repr
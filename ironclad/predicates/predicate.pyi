@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
-from typing import Final, Generic, Never, TypeAlias, TypeVar, overload
+from typing import Any, Final, Generic, Never, TypeAlias, TypeVar, overload
 
 __all__: Final[list[str]]
 
@@ -57,11 +57,30 @@ class Predicate(Generic[T]):
         label: str = "value",
         exc: ExceptionFactory[T],
     ) -> T: ...
+    @overload
+    def validate_many(
+        self,
+        xs: Iterable[T],
+        /,
+        *,
+        label: str = "value",
+        exc: type[BaseException] = ValueError,
+    ) -> list[T]: ...
+    @overload
+    def validate_many(
+        self,
+        xs: Iterable[T],
+        /,
+        *,
+        label: str = "value",
+        exc: ExceptionFactory[T],
+    ) -> list[T]: ...
     def with_name(self, name: str) -> Predicate[T]: ...
     @overload
     def with_msg(self, msg: str) -> Predicate[T]: ...
     @overload
     def with_msg(self, msg: Callable[[T | None], str]) -> Predicate[T]: ...
+    def with_cache(self, maxsize: int | None = 128) -> Predicate[T]: ...
     def __and__(self, other: Predicate[T]) -> Predicate[T]: ...
     def __rand__(self, other: Predicate[T]) -> Predicate[T]: ...
     def __or__(self, other: Predicate[T]) -> Predicate[T]: ...
@@ -114,3 +133,10 @@ class Predicate(Generic[T]):
     def exactly(self, n: int) -> Predicate[Iterable[T]]: ...
     def __bool__(self) -> Never: ...
     def __repr__(self) -> str: ...
+
+class PredicateError(ValueError):
+    pred: Predicate[Any]
+    label: str
+    x: Any
+
+    def __init__(self, pred: Predicate[Any], label: str, x: Any, /) -> None: ...
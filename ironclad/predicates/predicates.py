@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+import operator
 import re
-from collections.abc import Hashable, Mapping
-from typing import TYPE_CHECKING, Any, Protocol, Self, TypeVar
+import weakref
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from collections.abc import Set as AbcSet
+from typing import TYPE_CHECKING, Any, ParamSpec, Protocol, Self, TypeVar
 
 from ..type_repr import class_info_to_str
-from .predicate import Predicate
+from .predicate import Predicate, _always, _never
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sized
@@ -48,17 +52,49 @@ T = TypeVar("T")
 K = TypeVar("K", bound=Hashable)
 V = TypeVar("V")
 
+P = ParamSpec("P")
+
 AnyRealNumber = int | float
 
 
-ALWAYS = Predicate[Any](lambda _: True, "always", "always true")
+# (factory, args...) -> predicate; entries live as long as something uses them
+_INTERNED: weakref.WeakValueDictionary[Hashable, Predicate[Any]] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _interned(factory: Callable[P, Predicate[T]], /) -> Callable[P, Predicate[T]]:
+    # share one predicate between factory calls with the same arguments.
+    # equal arguments can still render differently (1 vs True, int | str vs
+    # str | int), so each argument is keyed by its type and repr too
+    @functools.wraps(factory)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Predicate[T]:
+        try:
+            key = (
+                factory,
+                *((type(a), a, repr(a)) for a in args),
+                *((k, type(v), v, repr(v)) for k, v in sorted(kwargs.items())),
+            )
+            pred = _INTERNED.get(key)
+        except TypeError:  # unhashable arguments, don't intern
+            return factory(*args, **kwargs)
+
+        if pred is None:
+            pred = _INTERNED[key] = factory(*args, **kwargs)
+        return pred
+
+    return wrapper
+
+
+ALWAYS = Predicate[Any](_always, "always", "always true")
 """A predicate that always evaluates to True."""
 
-NEVER = Predicate[Any](lambda _: False, "never", "always false")
+NEVER = Predicate[Any](_never, "never", "always false")
 """A predicate that always evaluates to False."""
 
 
 # --- simple predicates ---
+@_interned
 def equals(value: T) -> Predicate[T]:
     """A predicate that checks if a value is equal to another.
 
@@ -68,9 +104,15 @@ def equals(value: T) -> Predicate[T]:
     Returns:
         Predicate[T]: A predicate that checks if a value is equal to another.
     """
-    return Predicate(lambda x: x == value, "equals", lambda _: f"expected == {value!r}")
+    # bound to C callables rather than lambdas, so calls don't run a Python frame
+    return Predicate(
+        functools.partial(operator.eq, value),
+        "equals",
+        lambda _: f"expected == {value!r}",
+    )
 
 
+@_interned
 def between(low: C, high: C, /, *, inclusive: bool = True) -> Predicate[C]:
     """A predicate that checks if a value is within a range of values.
 
@@ -97,6 +139,7 @@ def between(low: C, high: C, /, *, inclusive: bool = True) -> Predicate[C]:
     )
 
 
+@_interned
 def instance_of(t: ClassInfo) -> Predicate[object]:
     """A predicate that checks if a value is an instance of a type/types.
 
@@ -106,15 +149,15 @@ def instance_of(t: ClassInfo) -> Predicate[object]:
     Returns:
         Predicate[object]: A predicate that checks if a value is an instance of a type.
     """
-    return Predicate(
-        lambda x: isinstance(x, t),
-        "instance of",
-        lambda _: f"expected instance of {class_info_to_str(t)}",
-    )
+    # flattening and naming the types only has to happen once
+    msg = f"expected instance of {class_info_to_str(t)}"
+    return Predicate(lambda x: isinstance(x, t), "instance of", lambda _: msg)
 
 
 NOT_NONE = Predicate[Any](
-    lambda x: x is not None, "not None", lambda _: "expected a not-None value"
+    functools.partial(operator.is_not, None),
+    "not None",
+    lambda _: "expected a not-None value",
 )
 """A predicate that checks if a value is not None.
 """
@@ -122,13 +165,17 @@ NOT_NONE = Predicate[Any](
 
 # --- numeric predicates ---
 POSITIVE = Predicate[AnyRealNumber](
-    lambda x: x > 0, "positive", lambda _: "expected a positive number"
+    functools.partial(operator.lt, 0),
+    "positive",
+    lambda _: "expected a positive number",
 )
 """A predicate that checks if a number is positive.
 """
 
 NEGATIVE = Predicate[AnyRealNumber](
-    lambda x: x < 0, "negative", lambda _: "expected a negative number"
+    functools.partial(operator.gt, 0),
+    "negative",
+    lambda _: "expected a negative number",
 )
 """A predicate that checks if a number is negative.
 """
@@ -149,10 +196,7 @@ def all_of(*predicates: Predicate[T]) -> Predicate[T]:
     """
     if len(predicates) < 1:
         raise ValueError("Cannot create a combined predicate from 0 predicates.")
-    final = predicates[0]
-    for pred in predicates[1::]:
-        final = final & pred
-    return final
+    return predicates[0]._combine("and", predicates[1:])
 
 
 def any_of(*predicates: Predicate[T]) -> Predicate[T]:
@@ -169,33 +213,63 @@ def any_of(*predicates: Predicate[T]) -> Predicate[T]:
     """
     if len(predicates) < 1:
         raise ValueError("Cannot create a combined predicate from 0 predicates.")
-    final = predicates[0]
-    for pred in predicates[1::]:
-        final = final | pred
-    return final
+    return predicates[0]._combine("or", predicates[1:])
 
 
 # --- sequence predicates ---
+_DIRECT_CONTAINERS = (AbcSet, Mapping, range, str, bytes, bytearray)
+"""Sources one_of uses as they are instead of copying them."""
+
+
+def _member_of(
+    members: frozenset[Any], pool: tuple[Any, ...], /
+) -> Callable[[Any], bool]:
+    def member_of(x: Any) -> bool:
+        try:
+            return x in members
+        except TypeError:  # unhashable x, which could still equal a value
+            return x in pool
+
+    return member_of
+
+
+@_interned
 def one_of(
     values: Iterable[T],
     /,
 ) -> Predicate[T]:
     """A predicate that checks if a value is one of the values in an iterable.
 
+    Sets, mappings, ranges, strings, and bytes are used as they are, since they
+    check membership directly (strings and bytes check for substrings, like the
+    `in` operator). Other iterables are read once, when the predicate is created.
+
     Args:
-    values (Iterable[T]): The iterable of valid values.
+        values (Iterable[T]): The iterable of valid values.
 
     Returns:
         Predicate[T]: A predicate that checks if the given value
             is in the iterable of valid values.
     """
-    return Predicate(
-        lambda x: x in values,
-        "one of",
-        lambda _: f"expected one of {values!r}",
-    )
+    if isinstance(values, _DIRECT_CONTAINERS):
+        # already fast to search (or, for strings, searched for substrings),
+        # so copying them would only cost time and memory
+        return Predicate(
+            functools.partial(operator.contains, values),
+            "one of",
+            lambda _: f"expected one of {values!r}",
+        )
+
+    pool = tuple(values)
+    shown = pool if isinstance(values, Iterator) else values
+    try:
+        func = _member_of(frozenset(pool), pool)
+    except TypeError:  # unhashable values, scan them instead
+        func = functools.partial(operator.contains, pool)
+    return Predicate(func, "one of", lambda _: f"expected one of {shown!r}")
 
 
+@_interned
 def length(size: int, /) -> Predicate[Sized]:
     """A predicate that checks if the given value has a size matching the given length.
 
@@ -213,6 +287,7 @@ def length(size: int, /) -> Predicate[Sized]:
     )
 
 
+@_interned
 def length_between(
     low: int, high: int, /, *, inclusive: bool = True
 ) -> Predicate[Sized]:
@@ -280,6 +355,7 @@ def values(inner: Predicate[V]) -> Predicate[Mapping[Hashable, V]]:
 
 
 # --- string predicates ---
+@_interned
 def regex(pattern: str, flags: int = 0) -> Predicate[str]:
     """A predicate that checks if a string matches the given regex.
 
@@ -10,7 +10,7 @@ __author__ = "Zentiph"
 __license__ = "MIT"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnforceOptions:
     """A configuration of type enforcement options."""
 
@@ -21,8 +21,67 @@ class EnforceOptions:
     strict_bools: bool = True
     """Whether to strictly disallow bools to count as integers."""
 
+    def __hash__(self) -> int:
+        """Get the hash of these options.
 
-DEFAULT_ENFORCE_OPTIONS: EnforceOptions = EnforceOptions()
+        Returns:
+            int: The hash.
+        """
+        # options key every compiled-checker cache, so pack them into one small
+        # int instead of hashing a tuple of the fields on every lookup
+        return (
+            (4 if self.allow_subclasses else 0)
+            + (2 if self.check_defaults else 0)
+            + (1 if self.strict_bools else 0)
+        )
+
+    @classmethod
+    def get(
+        cls,
+        *,
+        allow_subclasses: bool = True,
+        check_defaults: bool = True,
+        strict_bools: bool = True,
+    ) -> "EnforceOptions":
+        """Get the shared instance for a combination of options.
+
+        Equal options are interchangeable, so reusing one instance per
+        combination lets caches keyed by options match on identity.
+
+        Args:
+            allow_subclasses (bool, optional): Whether to allow subclasses to count
+                as a valid type for a parameter. Defaults to True.
+            check_defaults (bool, optional): Whether to apply defaults for missing
+                arguments. Defaults to True.
+            strict_bools (bool, optional): Whether to strictly disallow bools to
+                count as integers. Defaults to True.
+
+        Returns:
+            EnforceOptions: The interned options.
+        """
+        key = (allow_subclasses, check_defaults, strict_bools)
+        options = _INTERNED.get(key)
+        if options is None:
+            options = _INTERNED[key] = cls(*key)
+        return options
+
+    def interned(self) -> "EnforceOptions":
+        """Get the shared instance equal to these options.
+
+        Returns:
+            EnforceOptions: The interned options.
+        """
+        return EnforceOptions.get(
+            allow_subclasses=self.allow_subclasses,
+            check_defaults=self.check_defaults,
+            strict_bools=self.strict_bools,
+        )
+
+
+_INTERNED: dict[tuple[bool, bool, bool], EnforceOptions] = {}
+
+
+DEFAULT_ENFORCE_OPTIONS: EnforceOptions = EnforceOptions.get()
 """Default type enforcement options.
 
 (allow_subclasses=True, check_defaults=True, strict_bools=True)
@@ -16,5 +16,15 @@ class EnforceOptions:
     check_defaults: bool
     strict_bools: bool
 
+    @classmethod
+    def get(
+        cls,
+        *,
+        allow_subclasses: bool = True,
+        check_defaults: bool = True,
+        strict_bools: bool = True,
+    ) -> EnforceOptions: ...
+    def interned(self) -> EnforceOptions: ...
+
 DEFAULT_ENFORCE_OPTIONS: Final[EnforceOptions] = ...
 ClassInfo: TypeAlias = type | UnionType | tuple["ClassInfo", ...]
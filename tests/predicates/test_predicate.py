@@ -4,7 +4,7 @@ from collections.abc import Callable, Iterable, Sized
 
 import pytest
 
-from ironclad.predicates import Predicate
+from ironclad.predicates import Predicate, PredicateError
 
 
 def is_pos(x: int) -> bool:
@@ -70,12 +70,88 @@ def test_validate() -> None:
         pred.validate(-1)
 
 
+def test_subscription_returns_the_class() -> None:
+    assert Predicate[int] is Predicate
+    assert Predicate[int](is_pos, "is positive")(1) is True
+
+
+def test_validate_many() -> None:
+    pred = make_positive("expected positive number, got {x}")
+    assert pred.validate_many(iter((1, 2, 3))) == [1, 2, 3]
+    assert pred.validate_many([]) == []
+    with pytest.raises(
+        ValueError, match=r"^sizes\[1\]: expected positive number, got -2 \(got -2\)$"
+    ):
+        pred.validate_many([1, -2, -3], label="sizes")
+
+
+def test_validate_passes_custom_exceptions_a_message_string() -> None:
+    class ShoutError(Exception):
+        def __init__(self, msg: str) -> None:
+            super().__init__(msg.upper())
+
+    pred = make_positive("expected positive number")
+    with pytest.raises(
+        ShoutError, match=r"^VALUE: EXPECTED POSITIVE NUMBER \(GOT -1\)$"
+    ):
+        pred.validate(-1, exc=ShoutError)
+    with pytest.raises(TypeError) as info:
+        pred.validate_many([1, -1], label="xs", exc=TypeError)
+    assert info.value.args == ("xs[1]: expected positive number (got -1)",)
+
+
+def test_validate_formats_message_only_when_shown() -> None:
+    reprs: list[int] = []
+
+    class Big(int):
+        def __repr__(self) -> str:
+            reprs.append(int(self))
+            return "Big"
+
+    pred = make_positive("expected positive number")
+    with pytest.raises(ValueError) as info:
+        pred.validate(Big(-1))
+    assert reprs == []
+
+    assert str(info.value) == "value: expected positive number (got Big)"
+    assert reprs == [-1]
+    assert isinstance(info.value, PredicateError)
+    assert info.value.args == ("value: expected positive number (got Big)",)
+
+
 def test_with_changers() -> None:
     pred = make_positive()
     assert pred.with_name("abc").name == "abc"
     assert pred.with_msg("xyz").msg == "xyz"
 
 
+def test_with_cache_remembers_hashable_values() -> None:
+    calls: list[object] = []
+
+    def func(x: object) -> bool:
+        calls.append(x)
+        return x == 1
+
+    pred = Predicate(func, "is one").with_cache()
+    assert pred.name == "is one"
+
+    assert pred(1) is True
+    assert pred(1) is True
+    # equal but a different type, so tested separately
+    assert pred(True) is True  # noqa: FBT003 (boolean positional arg)
+    assert calls == [1, True]
+
+    calls.clear()
+    assert pred.all()([1, 1, 2]) is False
+    assert calls == [2]
+
+    # unhashable values are always tested
+    calls.clear()
+    assert pred([1]) is False
+    assert pred([1]) is False
+    assert calls == [[1], [1]]
+
+
 def test_and() -> None:
     pred1 = make_positive()
     pred2 = Predicate[int](lambda x: not is_pos(x), "is not positive")
@@ -116,6 +192,49 @@ def test_xor() -> None:
     assert combined(0) is False
 
 
+def test_chained_combinators_short_circuit() -> None:
+    calls: list[str] = []
+
+    def tracked(name: str, *, result: bool) -> Predicate[int]:
+        def func(_: int) -> bool:
+            calls.append(name)
+            return result
+
+        return Predicate(func, name)
+
+    combined = (
+        tracked("a", result=True)
+        & tracked("b", result=False)
+        & tracked("c", result=True)
+    )
+    assert combined(0) is False
+    assert calls == ["a", "b"]
+    assert combined.name == "a & b & c"
+    assert combined.render_msg() == "((a) and (b)) and (c)"
+
+    calls.clear()
+    either = (
+        tracked("a", result=False)
+        | tracked("b", result=True)
+        | tracked("c", result=True)
+    )
+    assert either(0) is True
+    assert calls == ["a", "b"]
+
+    calls.clear()
+    mixed = tracked("a", result=True) & ~tracked("b", result=True)
+    assert mixed(0) is False
+    assert calls == ["a", "b"]
+    assert mixed.render_msg() == "(a) and (not (b))"
+    assert (~tracked("a", result=True) | tracked("b", result=False))(0) is False
+
+    many = Predicate(lambda x: x > 0, "p")
+    for i in range(40):
+        many &= Predicate(lambda x, i=i: x != i, f"not {i}")
+    assert many(50) is True
+    assert many(39) is False
+
+
 def test_implies() -> None:
     pred1 = make_positive()
     pred2 = Predicate[int](lambda x: x > 3, "greater than 3")
@@ -226,6 +345,7 @@ def test_at_least() -> None:
     assert at_least_zero([0, 1, 2]) is True
     assert at_least_zero([-1, 0, 1]) is True
     assert at_least_zero([-2, -1, 0]) is True
+    assert at_least_zero([]) is True
 
     with pytest.raises(ValueError):
         pred.at_least(-10)
@@ -301,6 +421,7 @@ def test_render_with_context_and_tree() -> None:
     contextual = lifted.render_with_context(3)
     assert contextual.startswith("expected even positive number [via ")
     assert "'is positive' -> 'even positive'" in contextual
+    assert lifted.render_with_context(3, max_chain=1).endswith("[via 'even positive']")
 
     tree = lifted.render_tree(3)
     assert "even positive: expected even positive number" in tree
@@ -314,6 +435,14 @@ def test_quantify_uses_callable_message_prefix() -> None:
     msg = quantified.render_msg([1, -1])
     assert msg == "for at least one element: got invalid value 1"
 
+    # iterators aren't consumed just to render a sample
+    it = iter([5, 6])
+    assert (
+        quantified.render_msg(it) == "for at least one element: got invalid value None"
+    )
+    assert list(it) == [5, 6]
+    assert quantified.render_msg({7}) == "for at least one element: got invalid value 7"
+
 
 def test_validate_with_exception_factory() -> None:
     pred = make_positive("expected positive number, got {x}")
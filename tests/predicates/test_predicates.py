@@ -26,6 +26,38 @@ def test_always_and_never() -> None:
         assert predicates.NEVER(d) is False
 
 
+def test_constants_fold_out_of_combinations() -> None:
+    calls: list[int] = []
+
+    def positive(x: int) -> bool:
+        calls.append(x)
+        return x > 0
+
+    pred = predicates.Predicate(positive, "positive")
+    always, never = predicates.ALWAYS, predicates.NEVER
+    cases = (
+        (pred & always, (True, False)),
+        (pred | never, (True, False)),
+        (pred & ~never, (True, False)),
+        (never & pred, (False, False)),
+        (always | pred, (True, True)),
+        (~~pred, (True, False)),
+    )
+    for combined, expected in cases:
+        assert (combined(1), combined(-1)) == expected
+
+    # constants that decide a combination up front skip the other terms
+    assert calls == [1, -1] * 4
+
+    calls.clear()
+    assert (pred & pred)(1) is True
+    assert (pred | ~pred | pred)(-1) is True
+    assert calls == [1, -1, -1]
+
+    assert (pred & always).name == "positive & always"
+    assert (pred & always).render_msg() == "(positive) and (always true)"
+
+
 def test_equals() -> None:
     for target in ASSORTED_DATA:
         pred = predicates.equals(target)
@@ -52,6 +84,19 @@ def test_instance_of() -> None:
     _assert_truth_table(number_like, truthy=(1, -3, 2.4), falsy=("1", object()))
 
 
+def test_factories_share_predicates_for_identical_arguments() -> None:
+    assert predicates.instance_of(int) is predicates.instance_of(int)
+    assert predicates.between(1, 5) is predicates.between(1, 5)
+    assert predicates.between(1, 5) is not predicates.between(1, 5, inclusive=False)
+
+    # equal but differently rendered arguments keep their own predicates
+    assert predicates.equals(1) is not predicates.equals(True)  # noqa: FBT003
+    assert predicates.equals(True).render_msg() == "expected == True"  # noqa: FBT003
+
+    # unhashable arguments still work, just without sharing
+    assert predicates.one_of([1, 2])(2) is True
+
+
 def test_not_none() -> None:
     _assert_truth_table(
         predicates.NOT_NONE,
@@ -94,6 +139,13 @@ def test_all_of_and_any_of() -> None:
     any_combined = predicates.any_of(positive, even, divisible_by_three)
     _assert_truth_table(any_combined, truthy=(6, -6, 8, 3), falsy=(-1,))
 
+    # combining at once matches chaining the operators
+    chained = positive & even & divisible_by_three
+    assert all_combined.name == chained.name
+    assert all_combined.render_msg(1) == chained.render_msg(1)
+    assert any_combined.name == (positive | even | divisible_by_three).name
+    assert predicates.all_of(positive) is positive
+
     with pytest.raises(ValueError):
         predicates.all_of()
     with pytest.raises(ValueError):
@@ -110,6 +162,29 @@ def test_one_of() -> None:
     assert pred.render_msg("ignored") == f"expected one of {ASSORTED_DATA!r}"
 
 
+def test_one_of_reads_values_once() -> None:
+    pred = predicates.one_of(iter(["a", "b", "c"]))
+    _assert_truth_table(pred, truthy=("a", "c", "c"), falsy=("d", ["a"], 1))
+    assert pred.render_msg() == "expected one of ('a', 'b', 'c')"
+
+    # strings keep substring containment
+    text = predicates.one_of("abc")
+    _assert_truth_table(text, truthy=("a", "ab", "abc", ""), falsy=("d", "ac"))
+
+    # containers that check membership directly are used as they are
+    huge = predicates.one_of(range(10**12))
+    _assert_truth_table(huge, truthy=(0, 10**12 - 1), falsy=(10**12, -1))
+    assert huge.render_msg() == f"expected one of {range(10**12)!r}"
+
+    allowed = {"x"}
+    live = predicates.one_of(allowed)
+    allowed.add("y")
+    _assert_truth_table(live, truthy=("x", "y"), falsy=("z",))
+
+    large = predicates.one_of(range(1000))
+    _assert_truth_table(large, truthy=(0, 999, 5.0), falsy=(1000, "1", [1]))
+
+
 def test_length() -> None:
     length_three = predicates.length(3)
     _assert_truth_table(
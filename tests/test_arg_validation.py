@@ -7,6 +7,10 @@
 # pyright: reportUnknownParameterType=false
 # pyright: reportMissingParameterType=false
 
+import dataclasses
+import sys
+from typing import Annotated, Any, Literal, Optional, TypeVar
+
 import pytest
 
 from ironclad.arg_validation import (
@@ -14,6 +18,7 @@ from ironclad.arg_validation import (
     enforce_annotations,
     enforce_types,
     enforce_values,
+    validate,
 )
 from ironclad.predicates import Predicate
 from ironclad.types import EnforceOptions
@@ -70,6 +75,16 @@ def test_enforce_annotations_enforces_parameters_and_return() -> None:
         bad_return(5)
 
 
+def test_enforce_annotations_unwraps_annotated_return() -> None:
+    @enforce_annotations()
+    def scale(x: Annotated[int, "meta"]) -> Annotated[list[int], "meta"]:
+        return [x] if x >= 0 else [str(x)]  # type: ignore[list-item]
+
+    assert scale(2) == [2]
+    with pytest.raises(TypeError, match=r"return expected"):
+        scale(-1)
+
+
 def test_enforce_annotations_can_skip_return_check() -> None:
     @enforce_annotations(check_return=False)
     def echo(x: int) -> str:
@@ -118,3 +133,331 @@ def test_enforce_values_unknown_param_raises() -> None:
         @enforce_values(y=Predicate(lambda x: True, "dummy"))
         def _(x):
             return x
+
+
+def test_enforce_types_binds_kwonly_and_positional_only() -> None:
+    @enforce_types(a=int, b=int, c=str)
+    def func(a, /, b=2, *, c="c"):
+        return a, b, c
+
+    assert func(1) == (1, 2, "c")
+    assert func(1, b=3, c="d") == (1, 3, "d")
+
+    with pytest.raises(TypeError, match=r"'c' expected 'str'"):
+        func(1, c=3)
+
+    # bad calls still raise the usual binding errors
+    with pytest.raises(TypeError):
+        func(a=1)
+    with pytest.raises(TypeError):
+        func()
+
+
+def test_enforce_types_positional_and_keyword_calls_agree() -> None:
+    @enforce_types(x=int, y=str)
+    def func(x, y):
+        return x, y
+
+    assert func(1, "a") == func(1, y="a") == func(x=1, y="a") == (1, "a")
+
+    for call in (lambda: func(1, 2), lambda: func(1, y=2), lambda: func(x=1, y=2)):
+        with pytest.raises(TypeError, match=r"'y' expected 'str'"):
+            call()
+
+
+def test_enforce_values_positional_and_keyword_calls_agree() -> None:
+    positive = Predicate[int](lambda x: x > 0, "positive")
+
+    @enforce_values(y=positive)
+    def func(x, y=1, *, z=2):
+        return x, y, z
+
+    assert func(0, 3) == func(0, y=3) == func(x=0, y=3) == (0, 3, 2)
+    assert func(0) == (0, 1, 2)
+
+    for call in (lambda: func(0, -1), lambda: func(0, y=-1), lambda: func(0, -1, z=2)):
+        with pytest.raises(ValueError, match=r"'y' failed constraint"):
+            call()
+
+
+def test_enforce_types_checks_nested_generics() -> None:
+    @enforce_types(items=list[int], table=dict[str, tuple[int, str]])
+    def func(items, table):
+        return len(items) + len(table)
+
+    assert func([1, 2], {"a": (1, "x")}) == 3
+
+    with pytest.raises(TypeError, match=r"'items' expected"):
+        func([1, "2"], {})
+    with pytest.raises(TypeError, match=r"'table' expected"):
+        func([], {"a": (1, 2)})
+
+
+def test_enforce_types_checks_fixed_size_tuples() -> None:
+    @enforce_types(pair=tuple[int, str], wide=tuple[(int,) * 40])  # type: ignore[misc]
+    def func(pair, wide=(0,) * 40):
+        return pair, len(wide)
+
+    assert func((1, "a")) == ((1, "a"), 40)
+
+    with pytest.raises(TypeError, match=r"'pair' expected"):
+        func((1, "a", "b"))
+    with pytest.raises(TypeError, match=r"'pair' expected"):
+        func([1, "a"])
+    with pytest.raises(TypeError, match=r"'wide' expected"):
+        func((1, "a"), (0,) * 39 + ("0",))
+
+
+def test_enforce_types_unions_respect_strict_bools() -> None:
+    @enforce_types(x=int | str)
+    def func(x):
+        return x
+
+    assert func(1) == 1
+    assert func("a") == "a"
+
+    with pytest.raises(TypeError, match=r"no bools as ints"):
+        func(True)  # noqa: FBT003 (boolean positional arg)
+
+
+def test_enforce_types_unions_with_none_respect_strict_bools() -> None:
+    @enforce_types(x=int | None)
+    def func(x):
+        return x
+
+    assert func(1) == 1
+    assert func(None) is None
+
+    with pytest.raises(TypeError, match=r"no bools as ints"):
+        func(True)  # noqa: FBT003 (boolean positional arg)
+
+
+def test_enforce_types_unions_with_generics_reject_subclasses() -> None:
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    @enforce_types(EnforceOptions(allow_subclasses=False), x=Base | list[int])
+    def func(x):
+        return x
+
+    assert isinstance(func(Base()), Base)
+    with pytest.raises(TypeError, match=r"no subclasses"):
+        func(Child())
+
+
+def test_enforce_types_unions_mix_classes_and_generics() -> None:
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    @enforce_types(EnforceOptions(allow_subclasses=False), x=Base | list[int] | None)
+    def func(x):
+        return x
+
+    assert func(None) is None
+    assert func([1]) == [1]
+    assert isinstance(func(Base()), Base)
+
+    with pytest.raises(TypeError, match=r"'x' expected"):
+        func(Child())
+    with pytest.raises(TypeError, match=r"'x' expected"):
+        func(["1"])
+
+
+def test_enforce_types_unions_with_any_accept_everything() -> None:
+    opts = EnforceOptions(allow_subclasses=False)
+
+    @enforce_types(opts, x=Optional[Any], y=int | Any)  # noqa: UP045 (testing Optional)
+    def func(x, y=0):
+        return x, y
+
+    assert func(1, "s") == (1, "s")
+    assert func("s", 1.5) == ("s", 1.5)
+    assert func(None, None) == (None, None)
+
+
+def test_enforce_types_unions_of_generics_match_any_member() -> None:
+    class Items(list[int]):
+        pass
+
+    @enforce_types(x=list[int] | list[str] | dict[str, int] | tuple[float, ...])
+    def func(x):
+        return x
+
+    for ok in ([1], ["a"], Items([1]), {"a": 1}, (1.5,)):
+        assert func(ok) == ok
+
+    for bad in ([1.5], {"a": "b"}, (1,), "a"):
+        with pytest.raises(TypeError, match=r"'x' expected"):
+            func(bad)
+
+
+def test_enforce_types_literal_rejects_unhashable_values() -> None:
+    @enforce_types(mode=Literal["r", "w"])
+    def func(mode):
+        return mode
+
+    assert func("r") == "r"
+
+    with pytest.raises(TypeError, match=r"'mode' expected"):
+        func(["r"])
+
+
+def test_enforce_types_skips_unchecked_defaults() -> None:
+    @enforce_types(EnforceOptions(check_defaults=False), y=str)
+    def func(x, y=None):
+        return x, y
+
+    assert func(1) == (1, None)
+    assert func(1, "a") == (1, "a")
+
+    with pytest.raises(TypeError, match=r"'y' expected 'str'"):
+        func(1, y=2)
+
+
+def test_coerce_types_preserves_keyword_only_layout() -> None:
+    @coerce_types(b=int)
+    def func(a, /, b=0, *, c=1, **kw):
+        return a, b, c, kw
+
+    assert func("a", "2", c=3, d=4) == ("a", 2, 3, {"d": 4})
+    assert func("a", b="5") == ("a", 5, 1, {})
+
+
+def test_coerce_types_coerces_defaults_only_for_named_params() -> None:
+    @coerce_types(b=str)
+    def func(a=1, b=2, *args, **kw):
+        return a, b, args, kw
+
+    assert func() == (1, "2", (), {})
+    assert func(3, 4, 5, x=6) == (3, "4", (5,), {"x": 6})
+
+
+def test_enforce_options_are_interned() -> None:
+    opts = EnforceOptions(strict_bools=False)
+
+    assert opts.interned() is EnforceOptions.get(strict_bools=False)
+    assert opts.interned() == opts
+    assert EnforceOptions().interned() is EnforceOptions.get()
+    assert hash(opts) == hash(EnforceOptions.get(strict_bools=False))
+    assert hash(opts) != hash(EnforceOptions())
+
+
+def test_enforce_options_fields_are_only_the_options() -> None:
+    assert dataclasses.asdict(EnforceOptions(check_defaults=False)) == {
+        "allow_subclasses": True,
+        "check_defaults": False,
+        "strict_bools": True,
+    }
+    assert [f.name for f in dataclasses.fields(EnforceOptions)] == [
+        "allow_subclasses",
+        "check_defaults",
+        "strict_bools",
+    ]
+
+
+def test_coercion_keeps_positional_only_defaults_positional() -> None:
+    @coerce_types(b=str)
+    def func(a=1, b=2, /, c=3, *, d=4):
+        return a, b, c, d
+
+    assert func() == (1, "2", 3, 4)
+    assert func(5) == (5, "2", 3, 4)
+    assert func(d=6) == (1, "2", 3, 6)
+
+    @validate(coerce={"b": str})
+    def other(a=1, b=2, /):
+        return a, b
+
+    assert other() == (1, "2")
+    assert other(0) == (0, "2")
+
+
+def test_coerce_types_passes_through_unchanged_arguments() -> None:
+    data = [1, 2]
+
+    def add_key(kw):
+        kw["added"] = 1
+        return kw
+
+    @coerce_types(items=lambda x: x, extra=add_key)
+    def func(items, /, **extra):
+        return items, extra
+
+    items, extra = func(data, a=1)
+    assert items is data
+    assert extra == {"a": 1, "added": 1}
+
+
+def test_decorators_without_work_return_the_function() -> None:
+    def func(x):
+        return x
+
+    assert enforce_types()(func) is func
+    assert enforce_values()(func) is func
+    assert coerce_types(missing=int)(func) is func
+
+
+def test_enforce_annotations_wraps_once() -> None:
+    def func(x: int, *, y: str = "") -> str:
+        return x  # type: ignore[return-value]
+
+    wrapped = enforce_annotations()(func)
+    assert wrapped.__wrapped__ is func  # type: ignore[attr-defined]
+
+    with pytest.raises(TypeError, match=r"return expected"):
+        wrapped(1)
+    with pytest.raises(TypeError, match=r"return expected"):
+        wrapped(1, y="a")
+    with pytest.raises(TypeError, match=r"'y' expected 'str'"):
+        wrapped(1, y=2)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="needs __type_params__")
+def test_decorators_keep_type_params() -> None:
+    t = TypeVar("t")
+
+    def func(x):
+        return x
+
+    func.__type_params__ = (t,)  # type: ignore[attr-defined]
+
+    for decorator in (
+        enforce_types(x=int),
+        enforce_values(x=Predicate(lambda x: True, "dummy")),
+        coerce_types(x=int),
+        enforce_annotations(),
+    ):
+        assert decorator(func).__type_params__ == (t,)  # type: ignore[attr-defined]
+
+
+def test_validate_coerces_then_checks_in_one_pass() -> None:
+    positive = Predicate[int](lambda x: x > 0, "positive")
+
+    @validate(
+        coerce={"qty": int}, types={"qty": int, "item": str}, values={"qty": positive}
+    )
+    def order(item, qty=1, *, note=None):
+        return item, qty, note
+
+    assert order("apple", "3") == ("apple", 3, None)
+    assert order("apple", qty="2", note="x") == ("apple", 2, "x")
+    assert order("apple") == ("apple", 1, None)
+
+    with pytest.raises(ValueError, match=r"'qty' failed constraint"):
+        order("apple", "0")
+    with pytest.raises(TypeError, match=r"'item' expected 'str'"):
+        order(1, 2)
+
+
+def test_validate_unknown_param_raises() -> None:
+    with pytest.raises(ValueError, match=r"Unknown parameter 'y'"):
+
+        @validate(coerce={"y": int})
+        def func(x):
+            return x
@@ -87,3 +87,70 @@ def test_bool_is_not_treated_as_int_by_default() -> None:
 
     with pytest.raises(InvalidOverloadError, match=r"bool"):
         mm(True)  # noqa: FBT003 (boolean positional arg)
+
+
+def test_overloads_registered_after_calls_are_considered() -> None:
+    mm = Multimethod()
+
+    @mm.overload
+    def _(value: Any) -> str:
+        return "any"
+
+    assert mm(1) == "any"
+
+    @mm.overload
+    def _(value: int) -> str:
+        return "int"
+
+    assert mm(1) == "int"
+    assert mm(value=1) == "int"
+    assert mm("x") == "any"
+
+
+def test_dispatch_depends_on_values_for_generic_overloads() -> None:
+    mm = Multimethod()
+
+    @mm.overload
+    def _(value: list[int]) -> str:
+        return "ints"
+
+    @mm.overload
+    def _(value: list[str]) -> str:
+        return "strs"
+
+    assert mm([1]) == "ints"
+    assert mm(["a"]) == "strs"
+    assert mm([1]) == "ints"
+
+
+def test_dispatch_respects_faked_class() -> None:
+    class Fake:
+        @property
+        def __class__(self) -> type:  # type: ignore[override]
+            return str
+
+    mm = Multimethod()
+
+    @mm.overload
+    def _(value: str, *, flag: bool = False) -> str:
+        return "str"
+
+    @mm.overload
+    def _(value: Any, *, flag: bool = False) -> str:
+        return "any"
+
+    assert mm(Fake()) == "str"
+    assert mm(Fake(), flag=True) == "str"
+    assert mm(object()) == "any"
+    assert mm("a", flag=True) == mm("a") == "str"
+
+
+def test_multimethod_union_with_any_without_subclasses() -> None:
+    mm = Multimethod(options=EnforceOptions(allow_subclasses=False))
+
+    @mm.overload
+    def _(value: int | Any) -> str:
+        return f"got:{value}"
+
+    assert mm(1) == "got:1"
+    assert mm("s") == "got:s"